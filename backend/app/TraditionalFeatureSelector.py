@@ -1,19 +1,52 @@
 import numpy as np
 import pandas as pd
 import logging
-from sklearn.feature_selection import RFE, VarianceThreshold, SelectKBest, f_classif
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_selection import RFE, RFECV, VarianceThreshold, SelectKBest, f_classif
+from sklearn.ensemble import RandomForestClassifier, ExtraTreesClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
 from app.utils.results_formatter import format_selection_results
+from app.utils.correlation_stats import CorrelationStats, correlation_with_target
+from app.utils.wrapper_fitness import fixed_cv_splits
 
 logger = logging.getLogger(__name__)
 
+# Cheap filters that can shrink the search space ahead of the GA
+PREFILTER_METHODS = ('correlation', 'variance', 'kbest')
+
+# RFE estimators: (factory(random_state, n_jobs), importance getter)
+RFE_ESTIMATORS = {
+    'random_forest': (lambda random_state, n_jobs: RandomForestClassifier(
+        n_estimators=100, random_state=random_state, n_jobs=n_jobs), 'auto'),
+    # Random split thresholds make each tree much cheaper to grow
+    'extra_trees': (lambda random_state, n_jobs: ExtraTreesClassifier(
+        n_estimators=100, random_state=random_state, n_jobs=n_jobs), 'auto'),
+    'logistic_regression': (lambda random_state, n_jobs: make_pipeline(
+        StandardScaler(), LogisticRegression(max_iter=1000, random_state=random_state)
+    ), 'named_steps.logisticregression.coef_'),
+}
+
 class TraditionalFeatureSelector:
     def __init__(self, n_features=None, random_state=42, method='rfe', 
-                 variance_threshold=0.01):
+                 variance_threshold=0.01, rfe_step=1, rfe_estimator='random_forest',
+                 rfe_n_jobs=1, rfe_cv=False, cv_folds=5):
         self.n_features = n_features
         self.random_state = random_state
         self.method = method
         self.variance_threshold = variance_threshold
+        # Features dropped per RFE round: a count (>= 1) or a fraction of the remaining ones (< 1)
+        if rfe_step is None or rfe_step <= 0:
+            raise ValueError("rfe_step must be positive")
+        self.rfe_step = int(rfe_step) if rfe_step >= 1 else float(rfe_step)
+        if rfe_estimator not in RFE_ESTIMATORS:
+            raise ValueError(f"Unknown RFE estimator '{rfe_estimator}'")
+        self.rfe_estimator = rfe_estimator
+        self.rfe_n_jobs = rfe_n_jobs
+        # RFECV picks the feature count by cross-validation over fixed splits
+        self.rfe_cv = rfe_cv
+        self.cv_folds = cv_folds
+        self.diagnostics = None
         np.random.seed(random_state)
     
     def _should_exclude_feature(self, feature_name):
@@ -26,40 +59,30 @@ class TraditionalFeatureSelector:
         if len(selected_features) <= 1:
             return selected_features
         
-        # Calculate correlation matrix
-        corr_matrix = X[selected_features].corr().abs()
+        # Correlations among the selection and with the target, computed once
+        stats = CorrelationStats.from_frame(X[selected_features], y)
+        corr_matrix = np.abs(stats.correlation_matrix())
+        target_corr = np.abs(stats.target_correlation())
         
-        # Find features to remove
-        to_remove = set()
-        for i in range(len(selected_features)):
-            for j in range(i+1, len(selected_features)):
-                if corr_matrix.iloc[i, j] > max_correlation:
-                    # Remove the feature with lower correlation to target
-                    feat1, feat2 = selected_features[i], selected_features[j]
-                    corr1 = abs(X[feat1].corr(y))
-                    corr2 = abs(X[feat2].corr(y))
-                    
-                    if corr1 < corr2:
-                        to_remove.add(feat1)
-                    else:
-                        to_remove.add(feat2)
+        # Every highly correlated pair drops the feature less correlated with the target
+        # (the second one on ties or undefined correlations)
+        first, second = np.nonzero(np.triu(corr_matrix > max_correlation, k=1))
+        drop_first = target_corr[first] < target_corr[second]
+        to_remove = np.zeros(len(selected_features), dtype=bool)
+        to_remove[first[drop_first]] = True
+        to_remove[second[~drop_first]] = True
         
         # Return non-redundant features
-        return [f for f in selected_features if f not in to_remove]
+        return [f for f, removed in zip(selected_features, to_remove) if not removed]
     
     def _select_by_correlation(self, X, y, n_features):
         """Select features based on correlation with target"""
-        correlations = {}
-        for feature in X.columns:
-            if feature != 'id':  
-                corr = abs(X[feature].corr(y))
-                if not np.isnan(corr):
-                    correlations[feature] = corr
+        target_corr = correlation_with_target(X, y).abs()
+        target_corr = target_corr[(target_corr.index != 'id') & target_corr.notna()]
         
-   
-        # Sort by correlation and select top n
-        sorted_features = sorted(correlations.items(), key=lambda x: x[1], reverse=True)
-        selected = [feature for feature, score in sorted_features[:n_features]]
+        # Sort by correlation (ties keep column order) and select top n
+        order = np.argsort(-target_corr.to_numpy(), kind='stable')
+        selected = target_corr.index[order[:n_features]].tolist()
         selected = [f for f in selected if not self._should_exclude_feature(f)]
         
         # Remove redundant features
@@ -101,6 +124,77 @@ class TraditionalFeatureSelector:
             print(f"SelectKBest failed: {e}, using correlation fallback")
             return self._select_by_correlation(X, y, n_features)
     
+    def _select_by_rfe(self, X, y, n_features):
+        """Recursive feature elimination, optionally cross-validated"""
+        factory, importance_getter = RFE_ESTIMATORS[self.rfe_estimator]
+        self.diagnostics = {'rfe': {'estimator': self.rfe_estimator, 'step': self.rfe_step}}
+        
+        if self.rfe_cv:
+            # Folds run in parallel, so each estimator stays single-threaded;
+            # the splits are drawn once and shared by every elimination round
+            splits = fixed_cv_splits(np.asarray(y), self.cv_folds, self.random_state)
+            rfe = RFECV(
+                estimator=factory(self.random_state, 1),
+                step=self.rfe_step,
+                cv=splits,
+                n_jobs=self.rfe_n_jobs,
+                importance_getter=importance_getter
+            )
+            rfe.fit(X, y)
+            self.diagnostics['rfe'].update({
+                'cv_folds': len(splits),
+                'cv_n_features': int(rfe.n_features_),
+                'cv_mean_test_score': rfe.cv_results_['mean_test_score'].tolist()
+            })
+        else:
+            rfe = RFE(
+                estimator=factory(self.random_state, self.rfe_n_jobs),
+                n_features_to_select=n_features,
+                step=self.rfe_step,
+                importance_getter=importance_getter
+            )
+            rfe.fit(X, y)
+        
+        return X.columns[rfe.support_].tolist()
+    
+    def filter_scores(self, X, y, stats=None):
+        """
+        Per-feature score of the cheap filter in self.method: |correlation with
+        the target|, variance or the ANOVA F statistic. Correlation and variance
+        come from precomputed statistics (CorrelationStats or streamed
+        statistics) when given; otherwise every score is one O(n * p) pass.
+        Undefined scores rank last.
+        """
+        if self.method not in PREFILTER_METHODS:
+            raise ValueError(f"'{self.method}' is not a filter method, use one of {PREFILTER_METHODS}")
+        
+        if stats is not None and self.method != 'kbest':
+            if self.method == 'correlation':
+                scores = np.abs(stats.target_correlation())
+            else:
+                scores = stats.variances()
+        elif not isinstance(X, pd.DataFrame):
+            raise ValueError(f"The {self.method} filter needs the full dataset")
+        else:
+            if self.method == 'correlation':
+                # Same O(n * p) pass as the correlation ranking
+                scores = correlation_with_target(X, y).abs().to_numpy()
+            elif self.method == 'variance':
+                scores = X.to_numpy(dtype=float).var(axis=0, ddof=1)
+            else:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    scores = f_classif(X.to_numpy(dtype=float), y)[0]
+        
+        scores = np.where(np.isnan(scores), -np.inf, scores)
+        return pd.Series(scores, index=X.columns)
+    
+    def prefilter(self, X, y, size, stats=None):
+        """The `size` best-scoring usable features, in their original column order"""
+        scores = self.filter_scores(X, y, stats)
+        scores = scores[[not self._should_exclude_feature(f) for f in scores.index]]
+        order = np.argsort(-scores.to_numpy(), kind='stable')[:size]
+        return scores.index[np.sort(order)].tolist()
+    
     def run(self, X, y):
         """Run traditional feature selection with multiple methods"""
         print(f"Starting Traditional Feature Selection with method: {self.method}")
@@ -122,18 +216,7 @@ class TraditionalFeatureSelector:
                 selected_features = self._select_by_kbest(X, y, self.n_features)
                 
             else:  # RFE Recursive Feature Elimination (default)
-                estimator = RandomForestClassifier(
-                    n_estimators=100,
-                    random_state=self.random_state
-                )
-                
-                rfe = RFE(
-                    estimator=estimator, 
-                    n_features_to_select=self.n_features
-                )
-                
-                rfe.fit(X, y)
-                selected_features = X.columns[rfe.support_].tolist()
+                selected_features = self._select_by_rfe(X, y, self.n_features)
             
             # Format results
             results = format_selection_results(
@@ -145,7 +228,13 @@ class TraditionalFeatureSelector:
                     'random_state': self.random_state,
                     'method': self.method,
                     'variance_threshold': self.variance_threshold if self.method == 'variance' else None,
-                }
+                    'rfe_step': self.rfe_step if self.method == 'rfe' else None,
+                    'rfe_estimator': self.rfe_estimator if self.method == 'rfe' else None,
+                    'rfe_n_jobs': self.rfe_n_jobs if self.method == 'rfe' else None,
+                    'rfe_cv': self.rfe_cv if self.method == 'rfe' else None,
+                    'cv_folds': self.cv_folds if self.method == 'rfe' and self.rfe_cv else None,
+                },
+                diagnostics=self.diagnostics
             )
             
             print(f"Traditional Selection Completed! Selected {len(selected_features)} features")
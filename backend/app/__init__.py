@@ -8,9 +8,21 @@ def create_app():
     
     # Basic configuration
     app.config['UPLOAD_FOLDER'] = os.path.join(os.path.dirname(__file__), 'uploads')
-    app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB
+    app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_UPLOAD_SIZE', 50 * 1024 * 1024))  # 50MB default
     app.config['JSON_SORT_KEYS'] = False
     
+    # Background job settings
+    app.config['JOB_WORKERS'] = int(os.getenv('JOB_WORKERS', 2))
+    app.config['JOB_QUEUE_LIMIT'] = int(os.getenv('JOB_QUEUE_LIMIT', 20))
+    app.config['JOB_RESULT_TTL'] = int(os.getenv('JOB_RESULT_TTL', 3600))
+    app.config['SWEEP_MAX_RUNS'] = int(os.getenv('SWEEP_MAX_RUNS', 200))
+    
+    # Cleaned dataset cache settings
+    app.config['DATASET_CACHE_ENTRIES'] = int(os.getenv('DATASET_CACHE_ENTRIES', 8))
+    app.config['DATASET_CACHE_MB'] = float(os.getenv('DATASET_CACHE_MB', 512))
+    app.config['DATASET_CACHE_TTL'] = int(os.getenv('DATASET_CACHE_TTL', 1800))
+    app.config['DATASET_STORE_FOLDER'] = os.path.join(app.config['UPLOAD_FOLDER'], 'datasets')
+    
     # Initialize extensions
     api = Api(app)
     CORS(app)
@@ -22,9 +34,34 @@ def create_app():
     from app.utils.error_handlers import register_error_handlers
     register_error_handlers(app)
     
+    # Background job pool for long-running requests
+    from app.services.job_service import JobManager
+    app.extensions['job_manager'] = JobManager(
+        max_workers=app.config['JOB_WORKERS'],
+        queue_limit=app.config['JOB_QUEUE_LIMIT'],
+        result_ttl=app.config['JOB_RESULT_TTL']
+    )
+    
+    # Cache of cleaned uploads so repeated requests skip parsing and cleaning
+    from app.utils.dataset_cache import DatasetCache
+    app.extensions['dataset_cache'] = DatasetCache(
+        max_entries=app.config['DATASET_CACHE_ENTRIES'],
+        max_memory_mb=app.config['DATASET_CACHE_MB'],
+        ttl_seconds=app.config['DATASET_CACHE_TTL'],
+        store_dir=app.config['DATASET_STORE_FOLDER']
+    )
+    
     # Register routes
-    from app.routes.feature_selection import FeatureSelectionAPI, FeatureSelectionComparisonAPI
+    from app.routes.feature_selection import (
+        FeatureSelectionAPI, FeatureSelectionComparisonAPI, FeatureSelectionStreamAPI,
+        FeatureSelectionSweepAPI
+    )
+    from app.routes.jobs import JobStatusAPI, JobResultAPI
     api.add_resource(FeatureSelectionAPI, '/api/feature-selection')
     api.add_resource(FeatureSelectionComparisonAPI, '/api/feature-selection/compare')
+    api.add_resource(FeatureSelectionStreamAPI, '/api/feature-selection/stream')
+    api.add_resource(FeatureSelectionSweepAPI, '/api/feature-selection/sweep')
+    api.add_resource(JobStatusAPI, '/api/jobs/<string:job_id>')
+    api.add_resource(JobResultAPI, '/api/jobs/<string:job_id>/result')
     
     return app
\ No newline at end of file
@@ -1,92 +1,226 @@
 import numpy as np
 import pandas as pd
 import logging
-import random
-from app.utils.fitness import calculate_fitness
+import time
+from contextlib import nullcontext
+from app.utils.fitness import CorrelationFitness
+from app.utils.wrapper_fitness import WrapperFitness
+from app.utils.successive_halving import SuccessiveHalvingEvaluator
+from app.utils.streaming import StreamingDatasetStats
+from app.utils.fitness_cache import FitnessCache, chromosome_key
+from app.utils.parallel import ParallelFitnessEvaluator, resolve_n_jobs
 from app.utils.results_formatter import format_selection_results 
 
 logger = logging.getLogger(__name__)
 
+# Delta-fitness sums are recomputed from scratch this often to bound rounding drift
+DELTA_REFRESH_INTERVAL = 50
+
+
+def _take_sums(sums, rows):
+    return {key: value[rows] for key, value in sums.items()}
+
+
+def _concat_sums(first, second):
+    return {key: np.concatenate([first[key], second[key]]) for key in first}
+
 class GeneticFeatureSelector:
     def __init__(self, population_size=30, generations=50, crossover_prob=0.8, 
-                 mutation_prob=0.1, tournament_size=3, random_state=42):
+                 mutation_prob=0.1, tournament_size=3, random_state=42, n_jobs=1,
+                 cache_size=1024, patience=None, min_diversity=None, time_budget=None,
+                 elitism=0, steady_state=False, replacement_count=None,
+                 delta_fitness=False, fitness='correlation', cv_folds=5,
+                 wrapper_estimator='random_forest', wrapper_scoring='accuracy',
+                 low_fidelity_fraction=None, successive_halving=False, halving_min_fraction=0.1,
+                 halving_eta=3, progress_callback=None):
         self.population_size = population_size
         self.generations = generations
         self.crossover_prob = crossover_prob
         self.mutation_prob = mutation_prob
         self.tournament_size = tournament_size
         self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.cache_size = cache_size
+        self.patience = patience
+        self.min_diversity = min_diversity
+        self.time_budget = time_budget
+        self.elitism = elitism
+        self.steady_state = steady_state
+        # Steady-state mode replaces the worst `replacement_count` individuals per generation
+        if replacement_count is None:
+            replacement_count = max(1, population_size // 5)
+        self.replacement_count = replacement_count
+        # Score children by updating their nearest parent's running sums instead of from scratch
+        self.delta_fitness = delta_fitness
+        # 'correlation' (filter) or 'wrapper' (cross-validated estimator score)
+        if fitness not in ('correlation', 'wrapper'):
+            raise ValueError(f"Unknown fitness '{fitness}'")
+        self.fitness = fitness
+        self.cv_folds = cv_folds
+        self.wrapper_estimator = wrapper_estimator
+        self.wrapper_scoring = wrapper_scoring
+        self.low_fidelity_fraction = low_fidelity_fraction
+        # Score new wrapper chromosomes on growing row subsamples, keeping the top 1/eta each rung
+        self.successive_halving = successive_halving
+        self.halving_min_fraction = halving_min_fraction
+        self.halving_eta = halving_eta
+        # Called with a per-generation event dict; returning False cancels the run
+        self.progress_callback = progress_callback
         self.fitness_history = []
+        self.diversity_history = []
+        self.stopping_info = None
+        self.n_evaluations = 0
+        self.n_delta_evaluations = 0
+        self._sums = None
+        self._fitness_engine = None
+        self._evaluator = None
+        self._fitness_cache = None
+        self._valid_mask = None
         
-        np.random.seed(random_state)
-        random.seed(random_state)
+        # Single generator for every stochastic operator, so runs are reproducible
+        self.rng = np.random.default_rng(random_state)
     
-    def _initialize_population(self, n_features):
-        """Initialize population"""
-        population = []
-        for _ in range(self.population_size):
-            individual = [random.randint(0, 1) for _ in range(n_features)]
-            
-            # Ensure at least two features are selected (or all if fewer than 2 exist)
-            min_required = min(2, n_features)
-            current_selected = sum(individual)
-            if current_selected < min_required:
-                zeros = [i for i, v in enumerate(individual) if v == 0]
-                to_add = min_required - current_selected
-                chosen = random.sample(zeros, min(to_add, len(zeros)))
-                for idx in chosen:
-                    individual[idx] = 1
-                
-            population.append(individual)
+    def _ensure_min_features(self, population):
+        """Ensure at least two features are selected (or all if fewer than 2 exist)"""
+        n_features = population.shape[1]
+        min_required = min(2, n_features)
+        deficit = min_required - population.sum(axis=1)
+        rows = np.flatnonzero(deficit > 0)
+        if len(rows) == 0:
+            return population
+        
+        # Rank unselected genes in random order and switch on the first `deficit` of them
+        keys = self.rng.random((len(rows), n_features))
+        keys[population[rows]] = np.inf
+        ranks = np.argsort(np.argsort(keys, axis=1), axis=1)
+        population[rows] |= ranks < deficit[rows, None]
         return population
     
+    def _initialize_population(self, n_features):
+        """Initialize population as a (population_size, n_features) boolean matrix"""
+        population = self.rng.random((self.population_size, n_features)) < 0.5
+        return self._ensure_min_features(population)
+    
     def _should_exclude_feature(self, feature_name):
         """Exclude irrelevant features like ID columns"""
         exclude_patterns = ['id', 'ID', 'Id', 'patient', 'sample']
         return any(pattern in str(feature_name).lower() for pattern in exclude_patterns)
     
+    def _prepare_fitness(self, X, y, fitness_engine=None):
+        """Precompute correlations and the excluded-feature mask once per dataset"""
+        if self.fitness == 'wrapper':
+            if isinstance(X, StreamingDatasetStats):
+                raise ValueError("Wrapper fitness needs the full dataset, not streamed statistics")
+            # The wrapper engine memoizes its own scores, so the GA-level cache is skipped
+            fitness_engine = WrapperFitness(
+                X, y, estimator=self.wrapper_estimator, scoring=self.wrapper_scoring,
+                cv_folds=self.cv_folds, n_jobs=self.n_jobs, random_state=self.random_state,
+                cache_size=max(self.cache_size, 1)
+            )
+            if self.successive_halving:
+                fitness_engine = SuccessiveHalvingEvaluator(
+                    fitness_engine, min_fraction=self.halving_min_fraction, eta=self.halving_eta
+                )
+            elif self.low_fidelity_fraction:
+                # A single low-fidelity rung that promotes the better half
+                fitness_engine = SuccessiveHalvingEvaluator(
+                    fitness_engine, eta=2, fractions=[self.low_fidelity_fraction, 1.0]
+                )
+        elif fitness_engine is None or not fitness_engine.columns.equals(X.columns):
+            if isinstance(X, StreamingDatasetStats):
+                fitness_engine = CorrelationFitness.from_stats(X)
+            else:
+                fitness_engine = CorrelationFitness(X, y)
+        self._fitness_engine = fitness_engine
+        self._valid_mask = np.array(
+            [not self._should_exclude_feature(f) for f in X.columns], dtype=bool
+        )
+        use_cache = self.cache_size and self.fitness == 'correlation'
+        self._fitness_cache = FitnessCache(self.cache_size) if use_cache else None
+    
     def _fitness(self, individual, X, y):
         if sum(individual) == 0:
             return 0.0
         
-        individual_array = np.array(individual, dtype=bool)
-        selected_features = X.columns[individual_array].tolist()
+        if self._fitness_engine is None or not self._fitness_engine.columns.equals(X.columns):
+            self._prepare_fitness(X, y)
         
         # Filter out irrelevant features
-        valid_features = [f for f in selected_features if not self._should_exclude_feature(f)]
+        individual_array = np.array(individual, dtype=bool) & self._valid_mask
         
-        if not valid_features:
+        if not individual_array.any():
             return 0.0
         
-        return calculate_fitness(valid_features, X, y)
-    
-    def _mutate(self, individual):
-        mutated = individual[:]
-        for i in range(len(mutated)):
-            if random.random() < self.mutation_prob:
-                # 60% chance to remove
-                if mutated[i] == 1 and random.random() < 0.6:  
-                    mutated[i] = 0
-                else: 
-                    mutated[i] = 1
-        # Ensure at least two features are selected (or all if fewer than 2 exist)
-        min_required = min(2, len(mutated))
-        current_selected = sum(mutated)
-        if current_selected < min_required:
-            zeros = [i for i, v in enumerate(mutated) if v == 0]
-            to_add = min_required - current_selected
-            chosen = random.sample(zeros, min(to_add, len(zeros)))
-            for idx in chosen:
-                mutated[idx] = 1
-        return mutated
+        if self._fitness_cache is None:
+            self.n_evaluations += 1
+            return self._fitness_engine.score(individual_array)
+        
+        key = chromosome_key(individual_array)
+        score = self._fitness_cache.get(key)
+        if score is None:
+            self.n_evaluations += 1
+            score = self._fitness_engine.score(individual_array)
+            self._fitness_cache.put(key, score)
+        return score
+    
+    def _mutate(self, population):
+        """Bit-flip mutation over the whole offspring matrix"""
+        flip = self.rng.random(population.shape) < self.mutation_prob
+        # 60% chance to remove a selected gene, otherwise the gene ends up selected
+        remove = population & (self.rng.random(population.shape) < 0.6)
+        mutated = np.where(flip, ~remove, population)
+        return self._ensure_min_features(mutated)
     
     def _evaluate_population(self, population, X, y):
-        return [self._fitness(ind, X, y) for ind in population]
+        """Score the whole population matrix in one batch"""
+        if self._fitness_engine is None or not self._fitness_engine.columns.equals(X.columns):
+            self._prepare_fitness(X, y)
+        
+        # Filter out irrelevant features
+        masks = population & self._valid_mask
+        if self._fitness_cache is None:
+            return self._score_masks(masks)
+        
+        # Repeated chromosomes are served from the cache without re-scoring
+        return self._fitness_cache.score_population(masks, self._score_masks)
+    
+    def _evaluate_full(self, population):
+        """Score a population from scratch and keep its running sums for delta updates"""
+        self._sums = self._fitness_engine.population_sums(population & self._valid_mask)
+        self.n_evaluations += len(population)
+        return self._fitness_engine.score_sums(self._sums)
     
-    def _roulette_wheel_selection(self, population, fitness_scores):
+    def _evaluate_offspring(self, offspring, population, X, y):
+        """
+        Score new children. In delta mode each child starts from the sums of
+        its nearest current individual (fewest differing genes) and only the
+        flipped genes are applied; the child sums are returned alongside.
+        """
+        if self._sums is None:
+            return self._evaluate_population(offspring, X, y), None
+        
+        masks = offspring & self._valid_mask
+        current = population & self._valid_mask
+        # Hamming distance to every individual: |c| + |p| - 2 c.p
+        overlap = masks.astype(np.float32) @ current.T.astype(np.float32)
+        distance = masks.sum(axis=1)[:, None] + current.sum(axis=1)[None, :] - 2 * overlap
+        nearest = distance.argmin(axis=1)
+        
+        diffs = masks.astype(np.int8) - current[nearest].astype(np.int8)
+        sums = self._fitness_engine.update_sums(_take_sums(self._sums, nearest), diffs)
+        self.n_delta_evaluations += len(masks)
+        return self._fitness_engine.score_sums(sums), sums
+    
+    def _score_masks(self, masks):
+        evaluator = self._evaluator or self._fitness_engine
+        self.n_evaluations += len(masks)
+        return evaluator.score_population(masks)
+    
+    def _roulette_wheel_selection(self, population, fitness_scores, size=None):
         """Roulette wheel selection """
-        selected = []
         fitness = np.array(fitness_scores, dtype=float)
+        n_candidates = len(population)
+        size = n_candidates if size is None else size
 
         # Shift fitness if negative values present
         min_f = fitness.min()
@@ -97,77 +231,192 @@ class GeneticFeatureSelector:
 
         # If all fitnesses are zero (or nearly zero), fallback to random uniform selection
         if total_fitness == 0 or np.isclose(total_fitness, 0.0):
-            for _ in range(len(population)):
-                selected.append(random.choice(population)[:])
-            return selected
+            return population[self.rng.integers(0, n_candidates, size=size)]
 
         probs = fitness / total_fitness
-
-        for _ in range(len(population)):
-            idx = np.random.choice(len(population), p=probs)
-            selected.append(population[idx][:])
-
-        return selected
-    
-    def _crossover(self, parent1, parent2):
-        if random.random() < self.crossover_prob and len(parent1) > 1:
-            # Two-point crossover: select two points, swap the middle segment between parents
-            point1 = random.randint(1, len(parent1) - 2)
-            point2 = random.randint(point1, len(parent1) - 1)
-            child1 = parent1[:point1] + parent2[point1:point2] + parent1[point2:]
-            child2 = parent2[:point1] + parent1[point1:point2] + parent2[point2:]
-            return child1, child2
-        return parent1[:], parent2[:]
+        return population[self.rng.choice(n_candidates, size=size, p=probs)]
+    
+    def _crossover(self, parents1, parents2):
+        """Two-point crossover applied pairwise to two parent matrices"""
+        n_pairs, n_features = parents1.shape
+        if n_features <= 2:
+            return parents1.copy(), parents2.copy()
+        
+        # Two-point crossover: select two points, swap the middle segment between parents
+        point1 = self.rng.integers(1, n_features - 1, size=n_pairs)
+        point2 = self.rng.integers(point1, n_features)
+        genes = np.arange(n_features)
+        segment = (genes >= point1[:, None]) & (genes < point2[:, None])
+        segment &= (self.rng.random(n_pairs) < self.crossover_prob)[:, None]
+        
+        child1 = np.where(segment, parents2, parents1)
+        child2 = np.where(segment, parents1, parents2)
+        return child1, child2
     
     def _create_offspring(self, selected_population):
-        shuffled = selected_population[:]
-        random.shuffle(shuffled)
-        offspring = []
+        shuffled = selected_population[self.rng.permutation(len(selected_population))]
+        n_pairs = len(shuffled) // 2
         
-        for i in range(0, len(shuffled) - 1, 2):
-            child1, child2 = self._crossover(shuffled[i], shuffled[i + 1])
-            offspring.extend([child1, child2])
+        child1, child2 = self._crossover(shuffled[0:2 * n_pairs:2], shuffled[1:2 * n_pairs:2])
+        offspring = np.empty_like(shuffled)
+        offspring[0:2 * n_pairs:2] = child1
+        offspring[1:2 * n_pairs:2] = child2
         
-        if len(offspring) < len(selected_population):
-            offspring.append(shuffled[-1][:])
+        if len(shuffled) % 2:
+            offspring[-1] = shuffled[-1]
         
-        return [self._mutate(ind) for ind in offspring]
+        return self._mutate(offspring)
+    
+    def _population_diversity(self, population):
+        """Mean pairwise Hamming distance, as a fraction of the chromosome length"""
+        size, n_features = population.shape
+        if size < 2 or n_features == 0:
+            return 0.0
+        
+        # Each gene contributes ones * zeros differing pairs
+        ones = population.sum(axis=0)
+        differing_pairs = (ones * (size - ones)).sum()
+        return float(differing_pairs / (size * (size - 1) / 2) / n_features)
+    
+    def _check_stopping(self, generation, last_improvement, diversity, start_time):
+        """Return the name of the stopping criterion that fired, or None"""
+        if self.patience is not None and generation - last_improvement >= self.patience:
+            return 'patience'
+        if self.min_diversity is not None and diversity < self.min_diversity:
+            return 'diversity'
+        if self.time_budget is not None and time.time() - start_time >= self.time_budget:
+            return 'time_budget'
+        return None
+    
+    def _next_generation(self, population, fitness_scores, X, y):
+        """Breed the next population, evaluating only the newly created children"""
+        size = len(population)
+        elitism = min(self.elitism, size)
+        
+        if self.steady_state:
+            # Replace only the worst individuals; the top `elitism` are never replaced
+            n_children = max(0, min(self.replacement_count, size - elitism))
+            if n_children == 0:
+                return population, fitness_scores
+            parents = self._roulette_wheel_selection(population, fitness_scores, size=n_children)
+            children = self._create_offspring(parents)
+            worst = np.argsort(fitness_scores, kind='stable')[:n_children]
+            children_scores, children_sums = self._evaluate_offspring(children, population, X, y)
+            population = population.copy()
+            fitness_scores = np.array(fitness_scores, dtype=float)
+            population[worst] = children
+            fitness_scores[worst] = children_scores
+            if children_sums is not None:
+                self._sums = {key: value.copy() for key, value in self._sums.items()}
+                for key, value in children_sums.items():
+                    self._sums[key][worst] = value
+            return population, fitness_scores
+        
+        # Generational replacement, carrying the elite over unchanged
+        elite = np.argsort(fitness_scores, kind='stable')[size - elitism:]
+        selected = self._roulette_wheel_selection(population, fitness_scores, size=size - elitism)
+        offspring = self._create_offspring(selected)
+        offspring_scores, offspring_sums = self._evaluate_offspring(offspring, population, X, y)
+        if offspring_sums is not None:
+            self._sums = _concat_sums(_take_sums(self._sums, elite), offspring_sums)
+        return (
+            np.concatenate([population[elite], offspring]),
+            np.concatenate([np.asarray(fitness_scores, dtype=float)[elite], offspring_scores])
+        )
+    
+    def _report_progress(self, generation, fitness_scores, best_fitness, diversity, start_time):
+        """Send a generation event to the progress callback; False means cancel"""
+        if self.progress_callback is None:
+            return True
+        
+        event = {
+            'generation': generation,
+            'generations': self.generations,
+            'best_fitness': float(best_fitness),
+            'mean_fitness': float(np.mean(fitness_scores)),
+            'diversity': diversity,
+            'evaluations': self.n_evaluations,
+            'elapsed': round(time.time() - start_time, 3)
+        }
+        return self.progress_callback(event) is not False
     
     def _get_best_individual(self, population, fitness_scores):
         best_idx = np.argmax(fitness_scores)
-        return population[best_idx][:], fitness_scores[best_idx]
+        return population[best_idx].copy(), fitness_scores[best_idx]
     
-    def run(self, X, y):
+    def run(self, X, y, fitness_engine=None):
+        """Evolve feature subsets; a prebuilt fitness_engine for X, y skips the correlation setup"""
         n_features = X.shape[1]
         print("Starting Genetic Algorithm Evolution...")
         
+        self._prepare_fitness(X, y, fitness_engine)
         population = self._initialize_population(n_features)
         best_individual, best_fitness = None, 0.0
+        last_improvement = 0
+        start_time = time.time()
+        self.stopping_info = {'criterion': 'max_generations', 'generation': self.generations - 1}
         
-        for generation in range(self.generations):
-            fitness_scores = self._evaluate_population(population, X, y)
-            current_best, current_fitness = self._get_best_individual(population, fitness_scores)
-            
-            if current_fitness > best_fitness:
-                best_individual, best_fitness = current_best, current_fitness
-            
-            self.fitness_history.append(best_fitness)
-            
-            selected = self._roulette_wheel_selection(population, fitness_scores)
-            population = self._create_offspring(selected)
-            
-            if generation % 10 == 0:
-                print(f"Generation {generation}: Best Fitness = {best_fitness:.4f}")
+        # Worker processes share the precomputed arrays through memory-mapped files;
+        # the wrapper engine spends n_jobs on its CV folds instead
+        if resolve_n_jobs(self.n_jobs) > 1 and self.fitness == 'correlation':
+            evaluator = ParallelFitnessEvaluator(self._fitness_engine, self.n_jobs)
+        else:
+            evaluator = nullcontext(self._fitness_engine)
+        
+        # Delta updates assume every correlation is defined; NaN columns fall back to full scoring
+        self._sums = None
+        use_delta = (self.delta_fitness and self.fitness == 'correlation'
+                     and not self._fitness_engine.has_undefined)
+        
+        with evaluator as self._evaluator:
+            if use_delta:
+                fitness_scores = self._evaluate_full(population)
+            else:
+                fitness_scores = self._evaluate_population(population, X, y)
+            for generation in range(self.generations):
+                if generation > 0:
+                    population, fitness_scores = self._next_generation(
+                        population, fitness_scores, X, y
+                    )
+                    if use_delta and generation % DELTA_REFRESH_INTERVAL == 0:
+                        self._sums = self._fitness_engine.population_sums(population & self._valid_mask)
+                
+                current_best, current_fitness = self._get_best_individual(population, fitness_scores)
+                
+                if current_fitness > best_fitness:
+                    best_individual, best_fitness = current_best, current_fitness
+                    last_improvement = generation
+                
+                self.fitness_history.append(best_fitness)
+                diversity = self._population_diversity(population)
+                self.diversity_history.append(diversity)
+                
+                if not self._report_progress(generation, fitness_scores, best_fitness,
+                                             diversity, start_time):
+                    criterion = 'cancelled'
+                else:
+                    criterion = self._check_stopping(generation, last_improvement, diversity, start_time)
+                if criterion:
+                    self.stopping_info = {'criterion': criterion, 'generation': generation}
+                    print(f"Early stopping at generation {generation} ({criterion}): "
+                          f"Best Fitness = {best_fitness:.4f}")
+                    break
+                
+                if generation % 10 == 0:
+                    print(f"Generation {generation}: Best Fitness = {best_fitness:.4f}")
+        self._evaluator = None
         
+        return self._build_results(X, best_individual)
+    
+    def _build_results(self, X, best_individual):
+        """Format the best chromosome (or the correlation fallback) and the run diagnostics"""
         # Final feature selection
         if best_individual is None:
             # Use correlation-based fallback
-            correlations = {col: abs(X[col].corr(y)) for col in X.columns}
-            top_features = sorted(correlations.items(), key=lambda x: x[1], reverse=True)[:5]
-            selected_features = [feat for feat, score in top_features]
+            correlations = pd.Series(self._fitness_engine.target_corr, index=X.columns)
+            selected_features = correlations.nlargest(5).index.tolist()
         else:
-            individual_array = np.array(best_individual, dtype=bool)
-            selected_features = X.columns[individual_array].tolist()
+            selected_features = X.columns[best_individual].tolist()
             # Filter out irrelevant features
             selected_features = [f for f in selected_features if not self._should_exclude_feature(f)]
         
@@ -182,7 +431,33 @@ class GeneticFeatureSelector:
                 'generations': self.generations,
                 'crossover_prob': self.crossover_prob,
                 'mutation_prob': self.mutation_prob,
-                'random_state': self.random_state
+                'random_state': self.random_state,
+                'n_jobs': self.n_jobs,
+                'cache_size': self.cache_size,
+                'patience': self.patience,
+                'min_diversity': self.min_diversity,
+                'time_budget': self.time_budget,
+                'elitism': self.elitism,
+                'steady_state': self.steady_state,
+                'replacement_count': self.replacement_count if self.steady_state else None,
+                'delta_fitness': self.delta_fitness,
+                'fitness': self.fitness,
+                'cv_folds': self.cv_folds if self.fitness == 'wrapper' else None,
+                'wrapper_estimator': self.wrapper_estimator if self.fitness == 'wrapper' else None,
+                'wrapper_scoring': self.wrapper_scoring if self.fitness == 'wrapper' else None,
+                'low_fidelity_fraction': self.low_fidelity_fraction if self.fitness == 'wrapper' else None,
+                'successive_halving': self.successive_halving if self.fitness == 'wrapper' else None,
+                'halving_min_fraction': self.halving_min_fraction if self.successive_halving else None,
+                'halving_eta': self.halving_eta if self.successive_halving else None
+            },
+            diagnostics={
+                'fitness_evaluations': self.n_evaluations,
+                'delta_evaluations': self.n_delta_evaluations,
+                'generations_run': len(self.fitness_history),
+                'stopping': self.stopping_info,
+                'final_diversity': self.diversity_history[-1] if self.diversity_history else None,
+                'fitness_cache': self._fitness_cache.stats() if self._fitness_cache else None,
+                'wrapper': self._fitness_engine.stats() if self.fitness == 'wrapper' else None
             }
         )
         
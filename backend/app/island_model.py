@@ -0,0 +1,244 @@
+import shutil
+import tempfile
+import time
+from functools import partial
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from app.ga_feature_selection import GeneticFeatureSelector
+from app.utils.parallel import resolve_n_jobs, save_shared_arrays, load_shared_arrays, pool_context
+
+MIGRATION_TOPOLOGIES = ('ring', 'fully_connected')
+
+# (selector, X, y) of a pool worker process, set up once by _init_island_worker
+_island_worker = None
+
+
+def _build_island_worker(ga_params, X, y, engine_cls=None, array_paths=None, engine_params=None):
+    """The selector (and its fitness engine) that evolves islands, with the data it runs on"""
+    engine = None
+    if array_paths is not None:
+        engine = engine_cls.from_arrays(load_shared_arrays(array_paths), **engine_params)
+    selector = GeneticFeatureSelector(**ga_params)
+    selector._prepare_fitness(X, y, engine)
+    return selector, X, y
+
+
+def _init_island_worker(*args):
+    """Pool initializer: build the island worker once per process"""
+    global _island_worker
+    _island_worker = _build_island_worker(*args)
+
+
+def _model_fits(selector):
+    """Estimator fits made so far by a wrapper fitness engine (0 for correlation fitness)"""
+    if selector.fitness != 'wrapper':
+        return 0
+    return selector._fitness_engine.stats()['model_fits']
+
+
+def _evolve_island(state, start_generation, n_generations, worker=None):
+    """Advance one island by n_generations; the island's generator travels with its state"""
+    selector, X, y = worker if worker is not None else _island_worker
+    selector.rng = state['rng']
+    evaluations = selector.n_evaluations
+    model_fits = _model_fits(selector)
+    population, fitness_scores = state['population'], state['fitness']
+    history = []
+
+    for generation in range(start_generation, start_generation + n_generations):
+        if population is None:
+            population = selector._initialize_population(len(X.columns))
+            fitness_scores = selector._evaluate_population(population, X, y)
+        else:
+            population, fitness_scores = selector._next_generation(population, fitness_scores, X, y)
+
+        current_best, current_fitness = selector._get_best_individual(population, fitness_scores)
+        if current_fitness > state['best_fitness']:
+            state['best'], state['best_fitness'] = current_best, current_fitness
+        history.append(state['best_fitness'])
+
+    state.update({
+        'population': population,
+        'fitness': np.asarray(fitness_scores, dtype=float),
+        'rng': selector.rng,
+        'evaluations': state['evaluations'] + selector.n_evaluations - evaluations,
+        'model_fits': state['model_fits'] + _model_fits(selector) - model_fits,
+        'diversity': selector._population_diversity(population)
+    })
+    return state, history
+
+
+class IslandModelRunner:
+    """
+    Island-model GA: `islands` independent populations, each evolved by a
+    GeneticFeatureSelector in its own worker process with a seed spawned from
+    random_state. Every `migration_interval` generations the top
+    `migration_size` individuals of each island replace the worst ones of its
+    neighbour (ring) or of every other island (fully_connected).
+
+    Islands carry their own random generator, so results do not depend on
+    how many worker processes run them.
+    """
+
+    def __init__(self, ga_params, islands=4, migration_interval=10, migration_size=2,
+                 migration_topology='ring', progress_callback=None):
+        if islands < 1:
+            raise ValueError("islands must be at least 1")
+        if migration_interval < 1:
+            raise ValueError("migration_interval must be at least 1")
+        if migration_topology not in MIGRATION_TOPOLOGIES:
+            raise ValueError(f"Unknown migration topology '{migration_topology}'")
+
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migration_size = max(0, min(migration_size, ga_params.get('population_size', 30)))
+        self.migration_topology = migration_topology
+        self.n_workers = min(islands, resolve_n_jobs(ga_params.get('n_jobs', 1)))
+
+        # Each island is single-process; delta sums are not carried across epochs
+        self.island_params = dict(ga_params, n_jobs=1, delta_fitness=False)
+        # The coordinating selector tracks the merged history and formats the results
+        self.selector = GeneticFeatureSelector(**ga_params, progress_callback=progress_callback)
+
+    def _initial_states(self):
+        seeds = np.random.SeedSequence(self.selector.random_state).spawn(self.islands)
+        return [
+            {'island': i, 'rng': np.random.default_rng(seed), 'population': None, 'fitness': None,
+             'best': None, 'best_fitness': 0.0, 'evaluations': 0, 'model_fits': 0, 'diversity': 0.0}
+            for i, seed in enumerate(seeds)
+        ]
+
+    def _migrate(self, states):
+        """Replace each island's worst individuals with immigrants from its neighbours"""
+        m = self.migration_size
+        if m == 0 or len(states) < 2:
+            return
+        emigrants = []
+        for state in states:
+            top = np.argsort(state['fitness'], kind='stable')[::-1][:m]
+            emigrants.append((state['population'][top].copy(), state['fitness'][top].copy()))
+
+        for i, state in enumerate(states):
+            if self.migration_topology == 'ring':
+                population, fitness = emigrants[(i - 1) % len(states)]
+            else:
+                others = [emigrants[j] for j in range(len(states)) if j != i]
+                pool = np.concatenate([p for p, _ in others])
+                pool_fitness = np.concatenate([f for _, f in others])
+                top = np.argsort(pool_fitness, kind='stable')[::-1][:m]
+                population, fitness = pool[top], pool_fitness[top]
+            worst = np.argsort(state['fitness'], kind='stable')[:len(population)]
+            state['population'] = state['population'].copy()
+            state['population'][worst] = population
+            state['fitness'][worst] = fitness
+
+    def _worker_setup(self, X, y, fitness_engine, shared_dir):
+        """Initializer arguments: shared correlation arrays, or the data itself for wrapper fitness"""
+        # Also validates the setup and gives the coordinator an engine for the fallback selection
+        self.selector._prepare_fitness(X, y, fitness_engine)
+        if self.selector.fitness == 'wrapper':
+            return (self.island_params, X, y)
+
+        arrays, engine_params = self.selector._fitness_engine.to_arrays()
+        array_paths = save_shared_arrays(shared_dir, arrays)
+        # Workers only need the column names to map chromosomes back to features
+        columns_only = pd.DataFrame(columns=X.columns)
+        return (self.island_params, columns_only, None,
+                type(self.selector._fitness_engine), array_paths, engine_params)
+
+    def run(self, X, y, fitness_engine=None):
+        """Evolve the islands with periodic migration and return the best chromosome overall"""
+        selector = self.selector
+        print(f"Starting Island-Model Genetic Algorithm ({self.islands} islands, "
+              f"{self.n_workers} workers)...")
+
+        shared_dir = tempfile.mkdtemp(prefix='ga_islands_')
+        executor = None
+        try:
+            initargs = self._worker_setup(X, y, fitness_engine, shared_dir)
+            if self.n_workers > 1:
+                executor = ProcessPoolExecutor(max_workers=self.n_workers, mp_context=pool_context(),
+                                               initializer=_init_island_worker, initargs=initargs)
+                evolve, evolve_island = executor.map, _evolve_island
+            else:
+                # In-process runs share the request thread, so the worker stays local, not global
+                evolve, evolve_island = map, partial(_evolve_island, worker=_build_island_worker(*initargs))
+
+            states = self._initial_states()
+            best_fitness, last_improvement = 0.0, 0
+            start_time = time.time()
+            selector.stopping_info = {'criterion': 'max_generations', 'generation': selector.generations - 1}
+            migrations = 0
+            generation = 0
+
+            while generation < selector.generations:
+                n_generations = min(self.migration_interval, selector.generations - generation)
+                epoch = list(evolve(evolve_island, states, [generation] * len(states),
+                                    [n_generations] * len(states)))
+                states = [state for state, _ in epoch]
+                histories = np.array([history for _, history in epoch])
+
+                # Merged history: best fitness over all islands at each generation
+                for offset, value in enumerate(histories.max(axis=0)):
+                    if value > best_fitness:
+                        best_fitness, last_improvement = value, generation + offset
+                    selector.fitness_history.append(best_fitness)
+                generation += n_generations
+                last_generation = generation - 1
+
+                diversity = float(np.mean([state['diversity'] for state in states]))
+                selector.diversity_history.append(diversity)
+                selector.n_evaluations = sum(state['evaluations'] for state in states)
+                all_fitness = np.concatenate([state['fitness'] for state in states])
+                island_best = ', '.join(f"{state['best_fitness']:.4f}" for state in states)
+                print(f"Generation {last_generation}: Best Fitness = {best_fitness:.4f} "
+                      f"(islands: {island_best})")
+
+                if not selector._report_progress(last_generation, all_fitness, best_fitness,
+                                                 diversity, start_time):
+                    criterion = 'cancelled'
+                else:
+                    criterion = selector._check_stopping(last_generation, last_improvement,
+                                                         diversity, start_time)
+                if criterion:
+                    selector.stopping_info = {'criterion': criterion, 'generation': last_generation}
+                    print(f"Early stopping at generation {last_generation} ({criterion}): "
+                          f"Best Fitness = {best_fitness:.4f}")
+                    break
+
+                if generation < selector.generations:
+                    self._migrate(states)
+                    migrations += 1
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            shutil.rmtree(shared_dir, ignore_errors=True)
+
+        # Ties go to the lowest island index
+        winner = max(states, key=lambda state: (state['best_fitness'], -state['island']))
+        results = selector._build_results(X, winner['best'])
+
+        results['parameters_used'].update({
+            'islands': self.islands,
+            'migration_interval': self.migration_interval,
+            'migration_size': self.migration_size,
+            'migration_topology': self.migration_topology
+        })
+        # Caches and wrapper memos live in the workers; report per-island counts instead
+        diagnostics = results['diagnostics']
+        diagnostics['fitness_cache'] = None
+        if diagnostics.get('wrapper'):
+            diagnostics['wrapper'] = {
+                key: diagnostics['wrapper'][key] for key in ('estimator', 'scoring', 'cv_folds')
+            }
+            diagnostics['wrapper']['model_fits'] = sum(state['model_fits'] for state in states)
+        diagnostics['islands'] = [
+            {'island': state['island'], 'best_fitness': round(float(state['best_fitness']), 6),
+             'evaluations': state['evaluations'], 'model_fits': state['model_fits'],
+             'final_diversity': round(state['diversity'], 6)}
+            for state in states
+        ]
+        diagnostics['migrations'] = migrations
+        diagnostics['winning_island'] = winner['island']
+        return results
@@ -1,4 +1,7 @@
 from .individual import FeatureSelectionAPI
 from .comparison import FeatureSelectionComparisonAPI
+from .stream import FeatureSelectionStreamAPI
+from .sweep import FeatureSelectionSweepAPI
 
-__all__ = ['FeatureSelectionAPI', 'FeatureSelectionComparisonAPI']
\ No newline at end of file
+__all__ = ['FeatureSelectionAPI', 'FeatureSelectionComparisonAPI', 'FeatureSelectionStreamAPI',
+           'FeatureSelectionSweepAPI']
\ No newline at end of file
@@ -1,11 +1,17 @@
 import os
 import uuid
-from flask_restful import reqparse
-from flask import current_app
+from flask_restful import reqparse, inputs
+from flask import current_app, request
 from app.utils.validators import validate_file, validate_dataset_content
 from app.utils.error_handlers import APIError
 from app.utils.data_processor import process_uploaded_file, get_dataset_stats
 from app.utils.serialization import convert_to_serializable
+from app.utils.dataset_cache import compute_dataset_id
+from app.utils.streaming import stream_dataset_statistics
+from app.utils.wrapper_fitness import WRAPPER_ESTIMATORS, WRAPPER_SCORINGS
+from app.island_model import MIGRATION_TOPOLOGIES
+from app.TraditionalFeatureSelector import RFE_ESTIMATORS, PREFILTER_METHODS
+from app.services.job_service import get_job_manager
 
 
 class BaseFeatureSelection:
@@ -17,22 +23,194 @@ class BaseFeatureSelection:
         
         # Required parameters
         parser.add_argument('target_column', type=str, required=True, location='form')
+        parser.add_argument('dataset_id', type=str, default=None, location='form')
         parser.add_argument('random_state', type=int, default=42, location='form')
+        parser.add_argument('async', type=inputs.boolean, default=False, location='form')
+        parser.add_argument('streaming', type=inputs.boolean, default=False, location='form')
+        parser.add_argument('chunksize', type=int, default=50000, location='form')
         
         # GA parameters
         parser.add_argument('population_size', type=int, default=30, location='form')
         parser.add_argument('generations', type=int, default=50, location='form')
         parser.add_argument('crossover_prob', type=float, default=0.8, location='form')
         parser.add_argument('mutation_prob', type=float, default=0.1, location='form')
+        parser.add_argument('n_jobs', type=int, default=1, location='form')
+        parser.add_argument('cache_size', type=int, default=1024, location='form')
+        
+        # GA early stopping (disabled unless provided)
+        parser.add_argument('patience', type=int, default=None, location='form')
+        parser.add_argument('min_diversity', type=float, default=None, location='form')
+        parser.add_argument('time_budget', type=float, default=None, location='form')
+        
+        # GA generational model
+        parser.add_argument('elitism', type=int, default=0, location='form')
+        parser.add_argument('steady_state', type=inputs.boolean, default=False, location='form')
+        parser.add_argument('replacement_count', type=int, default=None, location='form')
+        parser.add_argument('delta_fitness', type=inputs.boolean, default=False, location='form')
+        
+        # GA fitness function
+        parser.add_argument('fitness', type=str, default='correlation',
+                          choices=['correlation', 'wrapper'], location='form')
+        parser.add_argument('cv_folds', type=int, default=5, location='form')
+        parser.add_argument('wrapper_estimator', type=str, default='random_forest',
+                          choices=list(WRAPPER_ESTIMATORS), location='form')
+        parser.add_argument('wrapper_scoring', type=str, default='accuracy',
+                          choices=list(WRAPPER_SCORINGS), location='form')
+        parser.add_argument('low_fidelity_fraction', type=float, default=None, location='form')
+        parser.add_argument('successive_halving', type=inputs.boolean, default=False, location='form')
+        parser.add_argument('halving_min_fraction', type=float, default=0.1, location='form')
+        parser.add_argument('halving_eta', type=int, default=3, location='form')
+        
+        # Two-stage mode: filter to the top prefilter_size features, then run the GA
+        parser.add_argument('prefilter', type=str, default=None,
+                          choices=list(PREFILTER_METHODS), location='form')
+        parser.add_argument('prefilter_size', type=int, default=200, location='form')
+        
+        # GA island model
+        parser.add_argument('islands', type=int, default=1, location='form')
+        parser.add_argument('migration_interval', type=int, default=10, location='form')
+        parser.add_argument('migration_size', type=int, default=2, location='form')
+        parser.add_argument('migration_topology', type=str, default='ring',
+                          choices=list(MIGRATION_TOPOLOGIES), location='form')
         
         # Traditional method parameters
         parser.add_argument('n_features', type=int, default=None, location='form')
         parser.add_argument('traditional_method', type=str, default='rfe', 
                           choices=['rfe', 'correlation', 'variance', 'kbest'], location='form')
         parser.add_argument('variance_threshold', type=float, default=0.01, location='form')
+        parser.add_argument('rfe_step', type=float, default=1, location='form')
+        parser.add_argument('rfe_estimator', type=str, default='random_forest',
+                          choices=list(RFE_ESTIMATORS), location='form')
+        parser.add_argument('rfe_n_jobs', type=int, default=1, location='form')
+        parser.add_argument('rfe_cv', type=inputs.boolean, default=False, location='form')
         
         return parser
     
+    def _get_ga_params(self, args):
+        """Collect GA parameters from parsed arguments"""
+        if args['prefilter'] and args['prefilter_size'] < 1:
+            raise APIError("prefilter_size must be a positive integer")
+        return {
+            'population_size': args['population_size'],
+            'generations': args['generations'],
+            'crossover_prob': args['crossover_prob'],
+            'mutation_prob': args['mutation_prob'],
+            'n_jobs': args['n_jobs'],
+            'cache_size': args['cache_size'],
+            'patience': args['patience'],
+            'min_diversity': args['min_diversity'],
+            'time_budget': args['time_budget'],
+            'elitism': args['elitism'],
+            'steady_state': args['steady_state'],
+            'replacement_count': args['replacement_count'],
+            'delta_fitness': args['delta_fitness'],
+            'fitness': args['fitness'],
+            'cv_folds': args['cv_folds'],
+            'wrapper_estimator': args['wrapper_estimator'],
+            'wrapper_scoring': args['wrapper_scoring'],
+            'low_fidelity_fraction': args['low_fidelity_fraction'],
+            'successive_halving': args['successive_halving'],
+            'halving_min_fraction': args['halving_min_fraction'],
+            'halving_eta': args['halving_eta'],
+            'prefilter': args['prefilter'],
+            'prefilter_size': args['prefilter_size'],
+            'islands': args['islands'],
+            'migration_interval': args['migration_interval'],
+            'migration_size': args['migration_size'],
+            'migration_topology': args['migration_topology'],
+            'random_state': args['random_state']
+        }
+    
+    def _get_traditional_params(self, args):
+        """Collect traditional method parameters from parsed arguments"""
+        if args['rfe_step'] <= 0:
+            raise APIError("rfe_step must be positive")
+        return {
+            'n_features': args['n_features'],
+            'random_state': args['random_state'],
+            'method': args['traditional_method'],
+            'variance_threshold': args['variance_threshold'],
+            'rfe_step': args['rfe_step'],
+            'rfe_estimator': args['rfe_estimator'],
+            'rfe_n_jobs': args['rfe_n_jobs'],
+            'rfe_cv': args['rfe_cv'],
+            'cv_folds': args['cv_folds']
+        }
+    
+    def _load_dataset(self, args):
+        """Load the dataset from the upload, reusing the cleaned copy from the dataset cache"""
+        cache = current_app.extensions['dataset_cache']
+        target_column = args['target_column']
+        file_path = None
+        
+        if 'file' in request.files:
+            file = request.files['file']
+            validate_file(file)
+            dataset_id = compute_dataset_id(file, target_column)
+            entry = cache.get(dataset_id)
+            if entry is None:
+                X, y, dataset_stats, file_path = self._process_uploaded_file(file, target_column)
+                entry = cache.put(dataset_id, X, y, dataset_stats, target_column)
+        elif args.get('dataset_id'):
+            entry = cache.get(args['dataset_id'])
+            if entry is None:
+                raise APIError(f"Dataset '{args['dataset_id']}' not found or expired, please upload the file again",
+                               status_code=404)
+            if entry['target_column'] != target_column:
+                raise APIError(f"Dataset '{args['dataset_id']}' was cached for target column "
+                               f"'{entry['target_column']}'")
+        else:
+            raise APIError("No file provided", status_code=400)
+        
+        self._dataset_entry = entry
+        return entry['X'], entry['y'], entry['dataset_stats'], file_path
+    
+    def _load_streaming_dataset(self, args):
+        """Save the upload and reduce it to streamed statistics without loading it whole"""
+        if 'file' not in request.files:
+            raise APIError("Streaming mode requires a file upload", status_code=400)
+        file = request.files['file']
+        if validate_file(file) != 'csv':
+            raise APIError("Streaming mode only supports CSV files")
+        if args['chunksize'] < 1:
+            raise APIError("chunksize must be a positive integer")
+        
+        filename = f"{uuid.uuid4()}_{file.filename}"
+        file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
+        file.save(file_path)
+        
+        try:
+            stats = stream_dataset_statistics(
+                file_path, args['target_column'], chunksize=args['chunksize'],
+                random_state=args['random_state']
+            )
+        except ValueError as e:
+            self._cleanup_file(file_path)
+            raise APIError(f"Invalid dataset file: {str(e)}")
+        
+        self._dataset_entry = {'dataset_id': None}
+        return stats, None, stats.to_dataset_stats(), file_path
+    
+    def _pinned_store(self):
+        """Context manager yielding the loaded dataset's store path, kept on disk for the block"""
+        return current_app.extensions['dataset_cache'].pinned_store(self._dataset_entry)
+    
+    def _get_fitness_engine(self):
+        """Cached correlation fitness engine for the loaded dataset"""
+        if self._dataset_entry['dataset_id'] is None:
+            return None
+        return current_app.extensions['dataset_cache'].get_fitness_engine(self._dataset_entry)
+    
+    def _dataset_info(self, X, target_column, dataset_stats):
+        """Dataset summary included in every response"""
+        return {
+            'dataset_id': self._dataset_entry['dataset_id'],
+            'samples': X.shape[0],
+            'features': X.shape[1],
+            'target_column': target_column,
+            'stats': dataset_stats
+        }
+    
     def _process_uploaded_file(self, file, target_column):
         """Common file processing logic"""
         # Validate file
@@ -43,17 +221,50 @@ class BaseFeatureSelection:
         file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
         file.save(file_path)
         
-        # Validate dataset content
+        # Parse once and validate dataset content
         df = validate_dataset_content(file_path, file_extension, target_column)
         
-        # Process dataset
-        X, y = process_uploaded_file(file_path, file_extension, target_column)
+        # Process the already parsed dataset
+        X, y = process_uploaded_file(file_path, file_extension, target_column, df=df)
         
         # Get dataset statistics
         dataset_stats = get_dataset_stats(X, y)
         
         return X, y, dataset_stats, file_path
     
+    def _submit_job(self, methods, X, y, args, dataset_stats):
+        """Queue the methods on the background worker pool and return a job reference"""
+        metadata = {
+            'message': f"Feature selection completed for methods: {', '.join(methods)}",
+            'dataset_info': self._dataset_info(X, args['target_column'], dataset_stats)
+        }
+        fitness_engine = self._get_fitness_engine() if 'ga' in methods else None
+        
+        # The store stays on disk until the job is done, even if the cache evicts it meanwhile
+        cache = current_app.extensions['dataset_cache']
+        dataset_path = cache.acquire_store(self._dataset_entry)
+        try:
+            job_id = get_job_manager().submit(
+                methods, X, y,
+                ga_params=self._get_ga_params(args),
+                traditional_params=self._get_traditional_params(args),
+                metadata=convert_to_serializable(metadata),
+                fitness_engine=fitness_engine,
+                dataset_path=dataset_path,
+                on_finished=lambda: cache.release_store(dataset_path)
+            )
+        except Exception:
+            cache.release_store(dataset_path)
+            raise
+        
+        return {
+            'success': True,
+            'job_id': job_id,
+            'status': 'queued',
+            'status_url': f"/api/jobs/{job_id}",
+            'result_url': f"/api/jobs/{job_id}/result"
+        }, 202
+    
     def _cleanup_file(self, file_path):
         """Clean up uploaded file"""
         if file_path and os.path.exists(file_path):
@@ -69,12 +280,7 @@ class BaseFeatureSelection:
             'success': True,
             'message': f"Feature selection completed successfully using {method_name}",
             'method_used': method_name,
-            'dataset_info': {
-                'samples': X.shape[0],
-                'features': X.shape[1],
-                'target_column': target_column,
-                'stats': dataset_stats
-            },
+            'dataset_info': self._dataset_info(X, target_column, dataset_stats),
             'results': results
         }
         
@@ -84,16 +290,17 @@ class BaseFeatureSelection:
         """Create standardized error response - UPDATED for enhanced APIError"""
         self._cleanup_file(file_path)
         
-        if status_code == 400:
+        if 400 <= status_code < 500:
             # Handle APIError with details
+            message = getattr(error, 'message', None) or str(error)
             if hasattr(error, 'details') and error.details:
                 return {
                     'success': False, 
-                    'error': error.message,
+                    'error': message,
                     'details': error.details
-                }, 400
+                }, status_code
             else:
-                return {'success': False, 'error': str(error)}, 400
+                return {'success': False, 'error': message}, status_code
         else:
             print(f"Feature selection failed: {str(error)}")
             return convert_to_serializable({
@@ -1,7 +1,5 @@
 from flask_restful import Resource
-from flask import request
-from app.services.ga_service import run_genetic_algorithm
-from app.services.traditional_service import run_traditional_method
+from app.services.comparison_service import run_methods
 from app.utils.comparison_engine import compare_methods_results
 from app.utils.error_handlers import APIError
 from .base import BaseFeatureSelection
@@ -17,39 +15,23 @@ class FeatureSelectionComparisonAPI(Resource, BaseFeatureSelection):
                           choices=['ga', 'traditional'], location='form')
         
         args = parser.parse_args()
-        
-        if 'file' not in request.files:
-            raise APIError("No file provided", status_code=400)
-        
-        file = request.files['file']
         file_path = None
         
         try:
-            # Process uploaded file
-            X, y, dataset_stats, file_path = self._process_uploaded_file(
-                file, args['target_column']
-            )
+            # Process uploaded file (or reuse a cached dataset)
+            X, y, dataset_stats, file_path = self._load_dataset(args)
+            
+            # Hand long runs to the background worker pool
+            if args['async']:
+                return self._submit_job(args['methods'], X, y, args, dataset_stats)
             
-            # Run selected methods with full parameters
-            results = {}
-            for method in args['methods']:
-                if method == 'ga':
-                    ga_params = {
-                        'population_size': args['population_size'],
-                        'generations': args['generations'],
-                        'crossover_prob': args['crossover_prob'],
-                        'mutation_prob': args['mutation_prob'],
-                        'random_state': args['random_state']
-                    }
-                    results['ga'] = run_genetic_algorithm(X, y, ga_params)
-                else:
-                    traditional_params = {
-                        'n_features': args['n_features'],
-                        'random_state': args['random_state'],
-                        'method': args['traditional_method'],
-                        'variance_threshold': args['variance_threshold']
-                    }
-                    results['traditional'] = run_traditional_method(X, y, traditional_params)
+            # Run selected methods with full parameters, concurrently when there are several
+            with self._pinned_store() as dataset_path:
+                results, timing = run_methods(
+                    args['methods'], X, y, self._get_ga_params(args), self._get_traditional_params(args),
+                    fitness_engine=self._get_fitness_engine() if 'ga' in args['methods'] else None,
+                    dataset_path=dataset_path
+                )
             
             # Add comparison if both methods were run
             comparison = None
@@ -59,14 +41,10 @@ class FeatureSelectionComparisonAPI(Resource, BaseFeatureSelection):
             response_data = {
                 'success': True,
                 'message': f"Comparison completed for methods: {', '.join(args['methods'])}",
-                'dataset_info': {
-                    'samples': X.shape[0],
-                    'features': X.shape[1],
-                    'target_column': args['target_column'],
-                    'stats': dataset_stats
-                },
+                'dataset_info': self._dataset_info(X, args['target_column'], dataset_stats),
                 'results': results,
-                'comparison': comparison
+                'comparison': comparison,
+                'timing': timing
             }
             
             return self._create_success_response(
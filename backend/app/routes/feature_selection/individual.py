@@ -1,7 +1,7 @@
 from flask_restful import Resource
-from flask import request
 from app.services.ga_service import run_genetic_algorithm
 from app.services.traditional_service import run_traditional_method
+from app.services.comparison_service import run_methods
 from app.utils.comparison_engine import compare_methods_results
 from app.utils.error_handlers import APIError
 from .base import BaseFeatureSelection
@@ -16,18 +16,31 @@ class FeatureSelectionAPI(Resource, BaseFeatureSelection):
         parser.add_argument('run_both', type=bool, default=False, location='form')
         
         args = parser.parse_args()
-        
-        if 'file' not in request.files:
-            raise APIError("No file provided", status_code=400)
-        
-        file = request.files['file']
         file_path = None
         
         try:
-            # Process uploaded file
-            X, y, dataset_stats, file_path = self._process_uploaded_file(
-                file, args['target_column']
-            )
+            # Streamed statistics only support the correlation-based GA
+            if args['streaming']:
+                if args['run_both'] or args['method'] != 'ga' or args['async']:
+                    raise APIError("Streaming mode supports only synchronous GA runs")
+                if args['prefilter'] == 'kbest':
+                    raise APIError("The kbest prefilter needs the full dataset, use correlation or variance")
+                if args['fitness'] == 'wrapper':
+                    raise APIError("Streaming mode supports only correlation fitness")
+                X, y, dataset_stats, file_path = self._load_streaming_dataset(args)
+                results = self._run_ga_method(X, y, args)
+                self._cleanup_file(file_path)
+                return self._create_success_response(
+                    X, args['target_column'], dataset_stats, "Genetic Algorithm (streaming)", results
+                )
+            
+            # Process uploaded file (or reuse a cached dataset)
+            X, y, dataset_stats, file_path = self._load_dataset(args)
+            
+            # Hand long runs to the background worker pool
+            if args['async']:
+                methods = ['ga', 'traditional'] if args['run_both'] else [args['method']]
+                return self._submit_job(methods, X, y, args, dataset_stats)
             
             # Run feature selection based on method
             if args['run_both']:
@@ -51,33 +64,26 @@ class FeatureSelectionAPI(Resource, BaseFeatureSelection):
 
     def _run_ga_method(self, X, y, args):
         """Run Genetic Algorithm feature selection"""
-        ga_params = {
-            'population_size': args['population_size'],
-            'generations': args['generations'],
-            'crossover_prob': args['crossover_prob'],
-            'mutation_prob': args['mutation_prob'],
-            'random_state': args['random_state']
-        }
-        return run_genetic_algorithm(X, y, ga_params)
+        return run_genetic_algorithm(
+            X, y, self._get_ga_params(args), fitness_engine=self._get_fitness_engine()
+        )
 
     def _run_traditional_method(self, X, y, args):
         """Run Traditional feature selection with method selection"""
-        traditional_params = {
-            'n_features': args['n_features'],
-            'random_state': args['random_state'],
-            'method': args['traditional_method'],
-            'variance_threshold': args['variance_threshold']
-        }
-        return run_traditional_method(X, y, traditional_params)
+        return run_traditional_method(X, y, self._get_traditional_params(args))
 
     def _run_both_methods(self, X, y, args):
-        """Run both methods and return comparison"""
-        ga_results = self._run_ga_method(X, y, args)
-        traditional_results = self._run_traditional_method(X, y, args)
-        comparison = compare_methods_results(ga_results, traditional_results)
+        """Run both methods concurrently and return comparison"""
+        with self._pinned_store() as dataset_path:
+            results, timing = run_methods(
+                ['ga', 'traditional'], X, y, self._get_ga_params(args), self._get_traditional_params(args),
+                fitness_engine=self._get_fitness_engine(), dataset_path=dataset_path
+            )
+        comparison = compare_methods_results(results['ga'], results['traditional'])
         
         return {
-            'ga_results': ga_results,
-            'traditional_results': traditional_results,
-            'comparison': comparison
+            'ga_results': results['ga'],
+            'traditional_results': results['traditional'],
+            'comparison': comparison,
+            'timing': timing
         }
\ No newline at end of file
@@ -0,0 +1,77 @@
+import json
+import queue
+import threading
+from flask_restful import Resource
+from flask import Response
+from app.services.ga_service import run_genetic_algorithm
+from app.utils.error_handlers import APIError
+from app.utils.serialization import convert_to_serializable
+from .base import BaseFeatureSelection
+
+
+def _format_sse(event, data):
+    """Format a single Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(convert_to_serializable(data))}\n\n"
+
+
+class FeatureSelectionStreamAPI(Resource, BaseFeatureSelection):
+    """Run the GA and stream per-generation progress as Server-Sent Events"""
+    
+    def post(self):
+        parser = self._setup_common_parser()
+        args = parser.parse_args()
+        file_path = None
+        
+        try:
+            # Process uploaded file before the stream starts so errors stay plain JSON
+            X, y, dataset_stats, file_path = self._load_dataset(args)
+            fitness_engine = self._get_fitness_engine()
+        except APIError as e:
+            return self._create_error_response(file_path, e, e.status_code)
+        except Exception as e:
+            return self._create_error_response(file_path, e, 500)
+        finally:
+            # The GA runs on the loaded (cached) data, the upload itself is no longer needed
+            self._cleanup_file(file_path)
+        
+        dataset_info = self._dataset_info(X, args['target_column'], dataset_stats)
+        events = queue.Queue()
+        cancelled = threading.Event()
+        
+        def on_generation(event):
+            events.put(('progress', event))
+            # Stop the GA once the client has gone away
+            return not cancelled.is_set()
+        
+        def worker():
+            try:
+                results = run_genetic_algorithm(
+                    X, y, self._get_ga_params(args),
+                    progress_callback=on_generation, fitness_engine=fitness_engine
+                )
+                events.put(('result', {
+                    'success': True,
+                    'dataset_info': dataset_info,
+                    'results': results
+                }))
+            except Exception as e:
+                events.put(('error', {'success': False, 'error': f"Feature selection failed: {str(e)}"}))
+        
+        def generate():
+            thread = threading.Thread(target=worker, daemon=True)
+            thread.start()
+            try:
+                while True:
+                    event, data = events.get()
+                    yield _format_sse(event, data)
+                    if event in ('result', 'error'):
+                        break
+            finally:
+                # Reached on completion and on client disconnect (GeneratorExit)
+                cancelled.set()
+        
+        return Response(
+            generate(),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
\ No newline at end of file
@@ -0,0 +1,93 @@
+import json
+from flask import current_app
+from flask_restful import Resource
+from app.services.sweep_service import expand_sweep, run_sweep
+from app.utils.error_handlers import APIError
+from app.utils.serialization import convert_to_serializable
+from .base import BaseFeatureSelection
+
+
+def _parse_json_arg(args, name, expected_type):
+    """Decode a JSON form field, raising APIError on malformed input"""
+    if args[name] is None:
+        return None
+    try:
+        value = json.loads(args[name])
+    except json.JSONDecodeError as e:
+        raise APIError(f"'{name}' is not valid JSON: {e}")
+    if not isinstance(value, expected_type):
+        raise APIError(f"'{name}' must be a JSON {expected_type.__name__}")
+    return value
+
+
+class FeatureSelectionSweepAPI(Resource, BaseFeatureSelection):
+    """Run a grid or list of GA/traditional configurations over several seeds on one dataset"""
+
+    def post(self):
+        parser = self._setup_common_parser()
+        parser.add_argument('methods', type=str, action='append', default=None,
+                          choices=['ga', 'traditional'], location='form')
+        parser.add_argument('grid', type=str, default=None, location='form')
+        parser.add_argument('configs', type=str, default=None, location='form')
+        parser.add_argument('seeds', type=str, default=None, location='form')
+        parser.add_argument('sweep_workers', type=int, default=-1, location='form')
+
+        args = parser.parse_args()
+        file_path = None
+
+        try:
+            # Validate the sweep before touching the dataset
+            grid = _parse_json_arg(args, 'grid', dict)
+            configs = _parse_json_arg(args, 'configs', list)
+            try:
+                configs = expand_sweep(grid, configs)
+            except ValueError as e:
+                raise APIError(str(e))
+            seeds = self._parse_seeds(args)
+            methods = list(dict.fromkeys(args['methods'] or ['ga']))
+
+            total_runs = len(configs) * len(methods) * len(seeds)
+            max_runs = current_app.config['SWEEP_MAX_RUNS']
+            if total_runs > max_runs:
+                raise APIError(f"Sweep has {total_runs} runs, the limit is {max_runs}")
+
+            # Parse, clean and compute correlation statistics once for every run
+            X, y, dataset_stats, file_path = self._load_dataset(args)
+            with self._pinned_store() as dataset_path:
+                table, sweep_info = run_sweep(
+                    configs, seeds, methods, X, y,
+                    ga_params=self._get_ga_params(args),
+                    traditional_params=self._get_traditional_params(args),
+                    fitness_engine=self._get_fitness_engine() if 'ga' in methods else None,
+                    dataset_path=dataset_path,
+                    n_workers=args['sweep_workers']
+                )
+
+            response_data = {
+                'success': True,
+                'message': f"Sweep completed: {sweep_info['runs']} runs "
+                           f"({sweep_info['distinct_runs']} distinct)",
+                'dataset_info': self._dataset_info(X, args['target_column'], dataset_stats),
+                'sweep': sweep_info,
+                'table': table
+            }
+            return convert_to_serializable(response_data), 200
+
+        except APIError as e:
+            return self._create_error_response(file_path, e, e.status_code)
+        except Exception as e:
+            return self._create_error_response(file_path, e, 500)
+
+    def _parse_seeds(self, args):
+        """Seeds as a JSON list or comma-separated integers; defaults to random_state"""
+        raw = args['seeds']
+        if raw is None:
+            return [args['random_state']]
+        try:
+            seeds = json.loads(raw) if raw.strip().startswith('[') else raw.split(',')
+            seeds = [int(seed) for seed in seeds]
+        except (ValueError, TypeError):
+            raise APIError("'seeds' must be a list of integers")
+        if not seeds:
+            raise APIError("'seeds' must not be empty")
+        return list(dict.fromkeys(seeds))
@@ -0,0 +1,3 @@
+from .job import JobStatusAPI, JobResultAPI
+
+__all__ = ['JobStatusAPI', 'JobResultAPI']
\ No newline at end of file
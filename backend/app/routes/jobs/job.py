@@ -0,0 +1,39 @@
+from flask_restful import Resource
+from app.services.job_service import get_job_manager
+from app.utils.error_handlers import APIError
+
+
+class JobStatusAPI(Resource):
+    """Status and progress of a background feature selection job"""
+    
+    def get(self, job_id):
+        try:
+            return {'success': True, **get_job_manager().get_status(job_id)}, 200
+        except APIError as e:
+            return {'success': False, 'error': e.message}, e.status_code
+    
+    def delete(self, job_id):
+        try:
+            status = get_job_manager().cancel(job_id)
+        except APIError as e:
+            return {'success': False, 'error': e.message}, e.status_code
+        
+        if status is None:
+            return {'success': False, 'error': 'Job has already finished'}, 409
+        return {'success': True, 'job_id': job_id, 'status': status}, 200
+
+
+class JobResultAPI(Resource):
+    """Result of a completed background feature selection job"""
+    
+    def get(self, job_id):
+        manager = get_job_manager()
+        try:
+            result = manager.get_result(job_id)
+        except APIError as e:
+            return {'success': False, 'error': e.message}, e.status_code
+        
+        if result is None:
+            # Not finished yet - report where the job is
+            return {'success': True, **manager.get_status(job_id)}, 202
+        return {'success': True, 'job_id': job_id, 'status': 'completed', **result}, 200
\ No newline at end of file
@@ -0,0 +1,56 @@
+import time
+from app.services.ga_service import run_genetic_algorithm
+from app.services.traditional_service import run_traditional_method
+from app.utils.dataset_store import open_dataset_store
+from app.utils.parallel import (resolve_n_jobs, run_in_shared_pool, shared_engine_files,
+                                load_shared_engine)
+
+
+def run_method(method, params, X, y, fitness_engine=None, dataset_path=None, shared_engine=None):
+    """Run one method; in a worker process X, y and the engine are mapped from shared files when given"""
+    if dataset_path is not None:
+        X, y = open_dataset_store(dataset_path)
+    if shared_engine is not None:
+        fitness_engine = load_shared_engine(shared_engine)
+    if method == 'ga':
+        return run_genetic_algorithm(X, y, params, fitness_engine=fitness_engine)
+    return run_traditional_method(X, y, params)
+
+
+def run_methods(methods, X, y, ga_params=None, traditional_params=None, fitness_engine=None,
+                dataset_path=None):
+    """
+    Run the requested methods ('ga', 'traditional') and return their results by name.
+
+    The methods are independent, so with more than one and more than one
+    core they run concurrently on the shared process pool; the wall time is
+    then close to the slowest method rather than the sum. Each result carries
+    its own execution_time (wall) and cpu_time.
+    """
+    methods = list(dict.fromkeys(methods))
+    params = {'ga': ga_params, 'traditional': traditional_params}
+    n_workers = min(len(methods), resolve_n_jobs(-1))
+    start_time = time.time()
+
+    if n_workers > 1:
+        # Send the store path and the engine's memory-mapped arrays rather than pickling them
+        data = (None, None) if dataset_path is not None else (X, y)
+        with shared_engine_files(fitness_engine if 'ga' in methods else None) as shared_engine:
+            calls = {
+                method: (method, params[method], *data, None, dataset_path,
+                         shared_engine if method == 'ga' else None)
+                for method in methods
+            }
+            results = run_in_shared_pool(run_method, calls, n_workers)
+    else:
+        results = {method: run_method(method, params[method], X, y, fitness_engine) for method in methods}
+
+    timing = {
+        'wall_time': round(time.time() - start_time, 2),
+        'concurrent': n_workers > 1,
+        'methods': {method: {'wall_time': result.get('execution_time'), 'cpu_time': result.get('cpu_time')}
+                    for method, result in results.items()}
+    }
+    print(f"Methods {', '.join(methods)} finished in {timing['wall_time']}s "
+          f"({'concurrent' if timing['concurrent'] else 'sequential'})")
+    return results, timing
@@ -1,28 +1,119 @@
+import copy
 import time
 from app.ga_feature_selection import GeneticFeatureSelector
+from app.island_model import IslandModelRunner
+from app.TraditionalFeatureSelector import TraditionalFeatureSelector
 from app.utils.data_processor import get_dataset_stats
+from app.utils.fitness import CorrelationFitness
+from app.utils.results_formatter import _get_feature_count_info
+from app.utils.streaming import StreamingDatasetStats
 
-def run_genetic_algorithm(X, y, ga_params=None):
+DEFAULT_GA_PARAMS = {
+    'population_size': 50,
+    'generations': 50,
+    'crossover_prob': 0.8,
+    'mutation_prob': 0.05,
+    'random_state': 42,
+    'n_jobs': 1,
+    'cache_size': 1024,
+    'patience': None,
+    'min_diversity': None,
+    'time_budget': None,
+    'elitism': 0,
+    'steady_state': False,
+    'replacement_count': None,
+    'delta_fitness': False,
+    'fitness': 'correlation',
+    'cv_folds': 5,
+    'wrapper_estimator': 'random_forest',
+    'wrapper_scoring': 'accuracy',
+    'low_fidelity_fraction': None,
+    'successive_halving': False,
+    'halving_min_fraction': 0.1,
+    'halving_eta': 3,
+    'islands': 1,
+    'migration_interval': 10,
+    'migration_size': 2,
+    'migration_topology': 'ring',
+    'prefilter': None,
+    'prefilter_size': 200
+}
+
+
+def _apply_prefilter(X, y, method, size, fitness_engine=None):
+    """
+    Shrink the search space to the `size` best features of a cheap filter.
+
+    Returns the reduced X, a fitness engine for it (sliced from the cached
+    engine's statistics when there is one) and a summary for the diagnostics.
+    Column names are kept, so the GA's selection maps straight back.
+    """
+    start_time = time.time()
+    streaming = isinstance(X, StreamingDatasetStats)
+    engine_stats = getattr(fitness_engine, 'stats', None)
+    stats = X if streaming else engine_stats
+    
+    keep = TraditionalFeatureSelector(method=method).prefilter(X, y, size, stats=stats)
+    if streaming:
+        # select_columns works in place; the caller's statistics stay whole
+        X_reduced = copy.copy(X).select_columns(X.columns.isin(keep))
+    else:
+        X_reduced = X[keep]
+    
+    reduced_engine = None
+    if engine_stats is not None and not streaming:
+        reduced_engine = CorrelationFitness.from_stats(engine_stats.subset(keep))
+    
+    info = {
+        'method': method,
+        'size': size,
+        'features_before': X.shape[1],
+        'features_after': len(keep),
+        'seconds': round(time.time() - start_time, 3)
+    }
+    print(f"Prefilter ({method}) kept {len(keep)} of {X.shape[1]} features")
+    return X_reduced, reduced_engine, info
+
+
+def run_genetic_algorithm(X, y, ga_params=None, progress_callback=None, fitness_engine=None):
     """Run Genetic Algorithm feature selection"""
     print("Starting Genetic Algorithm Feature Selection...")
     
-    default_params = {
-        'population_size': 50,
-        'generations': 50,
-        'crossover_prob': 0.8,
-        'mutation_prob': 0.05,
-        'random_state': 42
-    }
+    default_params = dict(DEFAULT_GA_PARAMS)
     if ga_params:
         default_params.update(ga_params)
     
     start_time = time.time()
+    start_cpu = time.process_time()
     
     try:
-        selector = GeneticFeatureSelector(**default_params)
-        results = selector.run(X, y)
+        # Two-stage mode: a cheap filter picks the search space, the GA searches it
+        prefilter = default_params.pop('prefilter')
+        prefilter_size = default_params.pop('prefilter_size')
+        X_search, prefilter_info = X, None
+        if prefilter:
+            X_search, fitness_engine, prefilter_info = _apply_prefilter(
+                X, y, prefilter, prefilter_size, fitness_engine
+            )
+        
+        island_params = {key: default_params.pop(key) for key in
+                         ('islands', 'migration_interval', 'migration_size', 'migration_topology')}
+        if island_params['islands'] > 1:
+            selector = IslandModelRunner(default_params, **island_params, progress_callback=progress_callback)
+        else:
+            selector = GeneticFeatureSelector(**default_params, progress_callback=progress_callback)
+        results = selector.run(X_search, y, fitness_engine=fitness_engine)
+        
+        if prefilter:
+            # Report against the original feature space
+            n_features, _, feature_reduction = _get_feature_count_info(X, results['selected_features'])
+            results['total_original_features'] = n_features
+            results['feature_reduction'] = feature_reduction
+            results['parameters_used'].update({'prefilter': prefilter, 'prefilter_size': prefilter_size})
+            results['diagnostics']['prefilter'] = prefilter_info
         
         results['execution_time'] = round(time.time() - start_time, 2)
+        results['cpu_time'] = round(time.process_time() - start_cpu, 2)
         results['dataset_stats'] = get_dataset_stats(X, y)
         
         
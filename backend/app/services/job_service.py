@@ -0,0 +1,236 @@
+import time
+import uuid
+import atexit
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from app.services.ga_service import run_genetic_algorithm
+from app.services.traditional_service import run_traditional_method
+from app.utils.comparison_engine import compare_methods_results
+from app.utils.error_handlers import APIError
+from app.utils.serialization import convert_to_serializable
+from app.utils.dataset_store import open_dataset_store
+from app.utils.parallel import pool_context
+
+
+def _update_progress(progress, job_id, **updates):
+    # Manager dict proxies only see reassignment, not in-place mutation
+    progress[job_id] = {**progress[job_id], **updates}
+
+
+def _cancel_key(job_id):
+    # Written only by the web process, so it never races with progress updates
+    return f"{job_id}:cancel"
+
+
+def _generation_callback(progress, job_id):
+    """GA progress hook that records each generation and honours cancellation"""
+    def callback(event):
+        _update_progress(progress, job_id, generation=event)
+        if progress.get(_cancel_key(job_id), False):
+            _update_progress(progress, job_id, cancelled=True)
+            return False
+        return True
+    return callback
+
+
+def execute_job(job_id, progress, methods, X, y, ga_params=None, traditional_params=None,
+                fitness_engine=None, dataset_path=None):
+    """Run the requested methods inside a worker process"""
+    if dataset_path is not None:
+        # Map the shared column store instead of receiving a pickled copy of X
+        X, y = open_dataset_store(dataset_path)
+    
+    total = len(methods)
+    progress[job_id] = {'stage': 'starting', 'completed_methods': 0,
+                        'total_methods': total, 'started_at': time.time()}
+    
+    results = {}
+    for i, method in enumerate(methods):
+        _update_progress(progress, job_id, stage=method, completed_methods=i)
+        # Checked after the stage is published, so cancel() sees either this stage or the stop
+        if progress.get(_cancel_key(job_id), False):
+            _update_progress(progress, job_id, cancelled=True)
+            break
+        if method == 'ga':
+            results['ga'] = run_genetic_algorithm(
+                X, y, ga_params, progress_callback=_generation_callback(progress, job_id),
+                fitness_engine=fitness_engine
+            )
+        else:
+            results['traditional'] = run_traditional_method(X, y, traditional_params)
+    
+    # Add comparison if both methods were run
+    comparison = None
+    if 'ga' in results and 'traditional' in results:
+        comparison = compare_methods_results(results['ga'], results['traditional'])
+    
+    _update_progress(progress, job_id, stage='finished', completed_methods=total)
+    return convert_to_serializable({'results': results, 'comparison': comparison})
+
+
+class JobManager:
+    """
+    Background job registry backed by a bounded local process pool.
+    
+    Jobs are submitted from the request thread and run in worker processes,
+    so long GA runs never block a web worker. Finished jobs are kept for
+    `result_ttl` seconds so clients can poll for the result.
+    
+    The registry lives in this process, so the app must be served by a
+    single web process (see gunicorn.conf.py); threads are fine.
+    """
+    
+    def __init__(self, max_workers=2, queue_limit=20, result_ttl=3600):
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.result_ttl = result_ttl
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._manager = None
+        self._progress = None
+    
+    def _ensure_started(self):
+        """Start the pool lazily so importing the app never forks workers"""
+        if self._executor is None:
+            # Not forked: this runs in a request thread while other threads may hold locks
+            context = pool_context()
+            self._manager = context.Manager()
+            self._progress = self._manager.dict()
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            # Stop the pool and the progress manager with the web process
+            atexit.register(self.shutdown)
+    
+    def _purge_expired(self):
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job['finished_at'] is not None and now - job['finished_at'] > self.result_ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+            self._progress.pop(job_id, None)
+            self._progress.pop(_cancel_key(job_id), None)
+    
+    def submit(self, methods, X, y, ga_params=None, traditional_params=None, metadata=None,
+               fitness_engine=None, dataset_path=None, on_finished=None):
+        """
+        Queue a feature selection job and return its id (X, y are not sent when
+        dataset_path is given). `on_finished` is called once the job is done,
+        failed or cancelled, e.g. to release the dataset store it reads.
+        """
+        with self._lock:
+            self._ensure_started()
+            self._purge_expired()
+            
+            active = sum(1 for job in self._jobs.values() if job['finished_at'] is None)
+            if active >= self.queue_limit:
+                raise APIError("Too many jobs in progress, please retry later", status_code=503)
+            
+            job_id = str(uuid.uuid4())
+            if dataset_path is not None:
+                X = y = None
+            future = self._executor.submit(
+                execute_job, job_id, self._progress, list(methods), X, y,
+                ga_params, traditional_params, fitness_engine, dataset_path
+            )
+            self._jobs[job_id] = {
+                'job_id': job_id,
+                'methods': list(methods),
+                'metadata': metadata or {},
+                'created_at': time.time(),
+                'finished_at': None,
+                'future': future
+            }
+            future.add_done_callback(lambda f, job_id=job_id: self._mark_finished(job_id))
+            if on_finished is not None:
+                future.add_done_callback(lambda f: on_finished())
+        
+        return job_id
+    
+    def _mark_finished(self, job_id):
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id]['finished_at'] = time.time()
+    
+    def _get(self, job_id):
+        with self._lock:
+            if self._executor is not None:
+                self._purge_expired()
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise APIError(f"Job '{job_id}' not found", status_code=404)
+        return job
+    
+    def _status(self, job):
+        future = job['future']
+        if future.cancelled():
+            return 'cancelled'
+        if future.done():
+            if future.exception() is not None:
+                return 'failed'
+            # Only a run the cancellation actually stopped counts as cancelled
+            stopped = self._progress.get(job['job_id'], {}).get('cancelled', False)
+            return 'cancelled' if stopped else 'completed'
+        if job['job_id'] in self._progress:
+            return 'running'
+        return 'queued'
+    
+    def get_status(self, job_id):
+        """Status and progress of a job"""
+        job = self._get(job_id)
+        status = self._status(job)
+        progress = dict(self._progress.get(job_id, {'stage': 'queued'}))
+        
+        info = {
+            'job_id': job_id,
+            'status': status,
+            'methods': job['methods'],
+            'progress': progress,
+            'created_at': job['created_at'],
+            'finished_at': job['finished_at'],
+        }
+        if status == 'failed':
+            info['error'] = str(job['future'].exception())
+        return convert_to_serializable(info)
+    
+    def get_result(self, job_id):
+        """Result payload of a completed job, or None while it is still pending"""
+        job = self._get(job_id)
+        status = self._status(job)
+        if status == 'failed':
+            raise APIError(f"Job failed: {job['future'].exception()}", status_code=500)
+        if status == 'cancelled':
+            raise APIError("Job was cancelled", status_code=410)
+        if status != 'completed':
+            return None
+        return {**job['metadata'], **job['future'].result()}
+    
+    def cancel(self, job_id):
+        """
+        Cancel a queued job, or ask a running GA to stop after its current
+        generation. Returns 'cancelled', 'cancelling' or None if the job has
+        already finished; a running traditional stage cannot be interrupted (409).
+        """
+        job = self._get(job_id)
+        if job['future'].cancel():
+            return 'cancelled'
+        if job['future'].done():
+            return None
+        if self._progress.get(job_id, {}).get('stage') == 'traditional':
+            raise APIError("The traditional method cannot be interrupted, wait for the job to finish",
+                           status_code=409)
+        self._progress[_cancel_key(job_id)] = True
+        return 'cancelling'
+    
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._manager.shutdown()
+            self._executor = None
+
+
+def get_job_manager():
+    """Job manager registered on the current application"""
+    from flask import current_app
+    return current_app.extensions['job_manager']
@@ -0,0 +1,140 @@
+import itertools
+import json
+import time
+import numpy as np
+from typing import Dict, Any, List, Optional
+from app.services.comparison_service import run_method
+from app.services.ga_service import DEFAULT_GA_PARAMS
+from app.services.traditional_service import DEFAULT_TRADITIONAL_PARAMS
+from app.utils.parallel import resolve_n_jobs, run_in_shared_pool, shared_engine_files
+
+# Sweep keys for the traditional method as named in the request form, mapped to its parameter names
+TRADITIONAL_SWEEP_KEYS = {('traditional_method' if k == 'method' else k): k
+                          for k in set(DEFAULT_TRADITIONAL_PARAMS) - {'random_state', 'rfe_n_jobs'}}
+GA_SWEEP_KEYS = set(DEFAULT_GA_PARAMS) - {'random_state', 'n_jobs'}
+
+# Numeric result fields summarized across seeds
+SWEEP_METRICS = {
+    'num_features': ('num_features',),
+    'execution_time': ('execution_time',),
+    'cpu_time': ('cpu_time',),
+    'redundancy_rate': ('feature_quality', 'redundancy_rate'),
+    'representation_entropy': ('feature_quality', 'representation_entropy'),
+    'feature_diversity_score': ('feature_quality', 'feature_diversity_score'),
+}
+
+
+def expand_sweep(grid: Optional[Dict[str, Any]] = None, configs: Optional[List[Dict[str, Any]]] = None
+                 ) -> List[Dict[str, Any]]:
+    """Cartesian product of a parameter grid followed by explicit configurations"""
+    expanded = []
+    if grid:
+        keys = list(grid)
+        values = [v if isinstance(v, list) else [v] for v in grid.values()]
+        expanded.extend(dict(zip(keys, combination)) for combination in itertools.product(*values))
+    expanded.extend(configs or [])
+    if not expanded:
+        expanded = [{}]
+
+    for config in expanded:
+        if not isinstance(config, dict):
+            raise ValueError("Each sweep configuration must be an object")
+        unknown = set(config) - GA_SWEEP_KEYS - set(TRADITIONAL_SWEEP_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown sweep parameters: {sorted(unknown)} (vary random_state with seeds)")
+    return expanded
+
+
+def _split_config(config):
+    """GA and traditional overrides of one sweep configuration"""
+    ga = {k: v for k, v in config.items() if k in GA_SWEEP_KEYS}
+    traditional = {TRADITIONAL_SWEEP_KEYS[k]: v for k, v in config.items() if k in TRADITIONAL_SWEEP_KEYS}
+    return ga, traditional
+
+
+def _metric(result, path):
+    for key in path:
+        if not isinstance(result, dict) or key not in result:
+            return None
+        result = result[key]
+    return result
+
+
+def _summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Mean and sample standard deviation of each metric across seeds"""
+    summary = {}
+    for name, path in SWEEP_METRICS.items():
+        values = [v for v in (_metric(run, path) for run in runs) if v is not None]
+        if values:
+            summary[name] = {
+                'mean': float(np.mean(values)),
+                'stdev': float(np.std(values, ddof=1)) if len(values) > 1 else 0.0
+            }
+    selections = [set(run.get('selected_features', [])) for run in runs]
+    summary['selected_in_all_seeds'] = sorted(set.intersection(*selections)) if selections else []
+    return summary
+
+
+def run_sweep(configs, seeds, methods, X, y, ga_params=None, traditional_params=None,
+              fitness_engine=None, dataset_path=None, n_workers=-1):
+    """
+    Run every configuration x method x seed on one prepared dataset.
+
+    The cleaned data and the correlation engine are shared by all runs, and
+    identical runs (e.g. a traditional method under a grid that only varies
+    GA parameters) execute once. Returns a table with one row per
+    configuration and method: the per-seed results plus a summary.
+    """
+    tasks = {}
+    rows = []
+    for config_id, config in enumerate(configs):
+        ga_overrides, traditional_overrides = _split_config(config)
+        for method in methods:
+            base, overrides = ((ga_params, ga_overrides) if method == 'ga'
+                               else (traditional_params, traditional_overrides))
+            keys = []
+            for seed in seeds:
+                params = {**(base or {}), **overrides, 'random_state': seed}
+                key = (method, json.dumps(params, sort_keys=True, default=str))
+                tasks.setdefault(key, (method, params))
+                keys.append(key)
+            rows.append({'config_id': config_id, 'config': config, 'method': method, 'keys': keys})
+
+    # The runs go to the process pool shared with other requests, at most n_workers at a time
+    n_workers = min(len(tasks), resolve_n_jobs(n_workers))
+    print(f"Starting sweep: {len(configs)} configurations x {len(methods)} methods x "
+          f"{len(seeds)} seeds, {len(tasks)} distinct runs on {n_workers} workers")
+    start_time = time.time()
+
+    if n_workers > 1:
+        # Send the store path and the engine's memory-mapped arrays rather than pickling them
+        data = (None, None) if dataset_path is not None else (X, y)
+        with shared_engine_files(fitness_engine) as shared_engine:
+            calls = {
+                key: (method, params, *data, None, dataset_path, shared_engine if method == 'ga' else None)
+                for key, (method, params) in tasks.items()
+            }
+            results = run_in_shared_pool(run_method, calls, n_workers)
+    else:
+        results = {key: run_method(*task, X, y, fitness_engine) for key, task in tasks.items()}
+
+    table = []
+    for row in rows:
+        runs = [results[key] for key in row.pop('keys')]
+        table.append({
+            **row,
+            'runs': [{'seed': seed, 'result': run} for seed, run in zip(seeds, runs)],
+            'summary': _summarize(runs)
+        })
+
+    info = {
+        'configurations': len(configs),
+        'methods': list(methods),
+        'seeds': list(seeds),
+        'runs': len(configs) * len(methods) * len(seeds),
+        'distinct_runs': len(tasks),
+        'workers': n_workers,
+        'wall_time': round(time.time() - start_time, 2)
+    }
+    print(f"Sweep completed in {info['wall_time']}s")
+    return table, info
@@ -2,28 +2,36 @@ import time
 from app.TraditionalFeatureSelector import TraditionalFeatureSelector
 from app.utils.data_processor import get_dataset_stats
 
+DEFAULT_TRADITIONAL_PARAMS = {
+    'n_features': None,
+    'random_state': 42,
+    'method': 'rfe',
+    'variance_threshold': 0.01,
+    'rfe_step': 1,
+    'rfe_estimator': 'random_forest',
+    'rfe_n_jobs': 1,
+    'rfe_cv': False,
+    'cv_folds': 5
+}
+
 
 def run_traditional_method(X, y, traditional_params=None):
     """Run Traditional feature selection"""
     print("Starting Traditional Feature Selection...")
     
-    default_params = {
-        'n_features': None,
-        'random_state': 42,
-        'method': 'rfe',
-        'variance_threshold': 0.01
-    }
-    
+    default_params = dict(DEFAULT_TRADITIONAL_PARAMS)
     if traditional_params:
         default_params.update(traditional_params)
     
     start_time = time.time()
+    start_cpu = time.process_time()
     
     try:
         selector = TraditionalFeatureSelector(**default_params)
         results = selector.run(X, y)
         
         results['execution_time'] = round(time.time() - start_time, 2)
+        results['cpu_time'] = round(time.process_time() - start_cpu, 2)
         results['dataset_stats'] = get_dataset_stats(X, y)
         
         # Enhanced logging
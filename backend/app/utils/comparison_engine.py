@@ -169,6 +169,8 @@ def compare_methods_results(ga_results: Dict[str, Any], traditional_results: Dic
             'performance_comparison': {
                 'execution_time_ga': float(metrics['ga_metrics']['time']),
                 'execution_time_traditional': float(metrics['trad_metrics']['time']),
+                'cpu_time_ga': float(ga_results.get('cpu_time', 0)),
+                'cpu_time_traditional': float(traditional_results.get('cpu_time', 0)),
                 'time_ratio': float(1 / metrics['ratios']['time'])  
             },
             'feature_analysis': {
@@ -200,7 +202,8 @@ def _create_error_comparison(error_msg: str) -> Dict[str, Any]:
             'reduction_ga': '0%', 'reduction_traditional': '0%'
         },
         'performance_comparison': {
-            'execution_time_ga': 0, 'execution_time_traditional': 0, 'time_ratio': 0
+            'execution_time_ga': 0, 'execution_time_traditional': 0,
+            'cpu_time_ga': 0, 'cpu_time_traditional': 0, 'time_ratio': 0
         },
         'feature_analysis': {
             'common_features': [], 'unique_to_ga': [], 
@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+from typing import List, Optional
+
+
+class CorrelationStats:
+    """
+    Mergeable sufficient statistics for Pearson correlations.
+
+    Holds the row count, column means and the centered cross-product
+    (co-moment) matrix of the feature columns, plus the target as an extra
+    trailing column when one is given. Batches are combined with Chan's
+    parallel update, so statistics can be built chunk by chunk, merged across
+    workers, or extended with appended rows without revisiting old ones.
+
+    Rows containing missing values are skipped (listwise deletion); the
+    cleaned datasets this backend works on are already imputed.
+    """
+
+    def __init__(self, columns: List[str], has_target: bool = False):
+        self.columns = pd.Index(columns)
+        self.has_target = has_target
+        size = len(self.columns) + int(has_target)
+        self.n_samples = 0
+        self.mean = np.zeros(size)
+        self.comoment = np.zeros((size, size))
+
+    @classmethod
+    def from_frame(cls, X: pd.DataFrame, y=None) -> 'CorrelationStats':
+        stats = cls(list(X.columns), has_target=y is not None)
+        return stats.append(X, y)
+
+    # ----- accumulation -----
+
+    def update(self, values: np.ndarray, target: Optional[np.ndarray] = None) -> 'CorrelationStats':
+        """Merge a block of raw rows (n_rows x n_columns, target as a separate vector)"""
+        data = np.asarray(values, dtype=float).reshape(-1, len(self.columns))
+        if self.has_target:
+            data = np.column_stack([data, np.asarray(target, dtype=float)])
+        data = data[~np.isnan(data).any(axis=1)]
+        if len(data) == 0:
+            return self
+        batch = CorrelationStats(self.columns, self.has_target)
+        batch.n_samples = len(data)
+        batch.mean = data.mean(axis=0)
+        centered = data - batch.mean
+        batch.comoment = centered.T @ centered
+        return self.merge(batch)
+
+    def append(self, X: pd.DataFrame, y=None) -> 'CorrelationStats':
+        """Add new rows of a DataFrame with the same columns"""
+        values = X[self.columns].to_numpy(dtype=float)
+        target = None if y is None else pd.Series(y).to_numpy(dtype=float)
+        return self.update(values, target)
+
+    def merge(self, other: 'CorrelationStats') -> 'CorrelationStats':
+        """Combine with statistics computed over a disjoint set of rows"""
+        if not self.columns.equals(other.columns) or self.has_target != other.has_target:
+            raise ValueError("Cannot merge correlation statistics over different columns")
+        if other.n_samples == 0:
+            return self
+        n_total = self.n_samples + other.n_samples
+        delta = other.mean - self.mean
+        self.comoment = self.comoment + other.comoment + np.outer(delta, delta) * (
+            self.n_samples * other.n_samples / n_total
+        )
+        self.mean = self.mean + delta * (other.n_samples / n_total)
+        self.n_samples = n_total
+        return self
+
+    def subset(self, columns: List[str]) -> 'CorrelationStats':
+        """Statistics restricted to some feature columns (the target is kept)"""
+        idx = self.columns.get_indexer(columns)
+        if (idx < 0).any():
+            missing = [c for c, i in zip(columns, idx) if i < 0]
+            raise KeyError(f"Columns not in correlation statistics: {missing}")
+        if self.has_target:
+            idx = np.append(idx, len(self.columns))
+        stats = CorrelationStats(list(columns), self.has_target)
+        stats.n_samples = self.n_samples
+        stats.mean = self.mean[idx]
+        stats.comoment = self.comoment[np.ix_(idx, idx)]
+        return stats
+
+    def __getitem__(self, columns):
+        if isinstance(columns, str):
+            columns = [columns]
+        return self.subset(list(columns))
+
+    # ----- derived statistics -----
+
+    @property
+    def sums(self) -> np.ndarray:
+        return self.mean * self.n_samples
+
+    @property
+    def cross_products(self) -> np.ndarray:
+        """Raw (uncentered) cross-product matrix"""
+        return self.comoment + np.outer(self.mean, self.mean) * self.n_samples
+
+    def covariance(self) -> np.ndarray:
+        """Sample covariance (target last when present)"""
+        return self.comoment / max(self.n_samples - 1, 1)
+
+    def variances(self) -> np.ndarray:
+        return np.diag(self.covariance())[:len(self.columns)]
+
+    def _full_correlation(self) -> np.ndarray:
+        std = np.sqrt(np.diag(self.comoment))
+        scale = np.outer(std, std)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.clip(self.comoment / scale, -1.0, 1.0)
+        corr[scale == 0] = np.nan
+        np.fill_diagonal(corr, np.where(std > 0, 1.0, np.nan))
+        return corr
+
+    def correlation_matrix(self) -> np.ndarray:
+        """Pearson correlation between feature columns"""
+        n_features = len(self.columns)
+        return self._full_correlation()[:n_features, :n_features]
+
+    def target_correlation(self) -> np.ndarray:
+        """Pearson correlation of each feature with the target"""
+        if not self.has_target:
+            raise ValueError("Correlation statistics were built without a target")
+        # Only the target column of the co-moment is needed, not the full matrix
+        n_features = len(self.columns)
+        std = np.sqrt(np.diag(self.comoment))
+        scale = std[:n_features] * std[-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.clip(self.comoment[:n_features, -1] / scale, -1.0, 1.0)
+        corr[scale == 0] = np.nan
+        return corr
+
+    def correlations(self):
+        """Feature correlation matrix and target correlations from one normalization"""
+        if not self.has_target:
+            raise ValueError("Correlation statistics were built without a target")
+        n_features = len(self.columns)
+        corr = self._full_correlation()
+        return corr[:n_features, :n_features], corr[:n_features, -1]
+
+    # pandas-style accessors, so a stats subset can stand in for X[cols]
+    def corr(self) -> pd.DataFrame:
+        return pd.DataFrame(self.correlation_matrix(), index=self.columns, columns=self.columns)
+
+    def var(self) -> pd.Series:
+        return pd.Series(self.variances(), index=self.columns)
+
+    def corrwith_target(self) -> pd.Series:
+        return pd.Series(self.target_correlation(), index=self.columns)
+
+
+def correlation_with_target(X: pd.DataFrame, y) -> pd.Series:
+    """
+    Pearson correlation of each column of X with y in one O(n * p) pass.
+
+    Same values as CorrelationStats.from_frame(X, y).corrwith_target() without
+    building the (p + 1)^2 co-moment matrix.
+    """
+    values = X.to_numpy(dtype=float)
+    target = np.asarray(y, dtype=float)
+    complete = ~(np.isnan(values).any(axis=1) | np.isnan(target))
+    if not complete.all():
+        values, target = values[complete], target[complete]
+    if len(values) == 0:
+        return pd.Series(np.nan, index=X.columns)
+    centered = values - values.mean(axis=0)
+    target = target - target.mean()
+    scale = np.sqrt(np.einsum('ij,ij->j', centered, centered)) * np.sqrt(target @ target)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = np.clip(centered.T @ target / scale, -1.0, 1.0)
+    corr[scale == 0] = np.nan
+    return pd.Series(corr, index=X.columns)
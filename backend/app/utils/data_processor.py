@@ -1,20 +1,55 @@
 import pandas as pd
 import numpy as np
 import logging
-from typing import Tuple, Dict, Any
+import warnings
+from typing import Tuple, Dict, Any, Optional
+from app.utils.streaming import StreamingDatasetStats
+from app.utils.correlation_stats import correlation_with_target
 
 logger = logging.getLogger(__name__)
 
-def process_uploaded_file(file_path: str, file_extension: str, target_column: str) -> Tuple[pd.DataFrame, pd.Series]:
-    """Process uploaded file and extract X, y"""
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+def _float32_is_safe(values: pd.Series) -> bool:
+    """True if every value has at most 6 significant digits, which float32 round-trips exactly"""
+    values = values.dropna().to_numpy(dtype=np.float64)
+    if len(values) == 0 or not np.isfinite(values).all():
+        return False
+    if np.abs(values).max() > np.finfo(np.float32).max:
+        return False
+    # Scale each value to 6 integer digits; anything left after the point needs more precision
+    nonzero = np.abs(values[values != 0])
+    scaled = nonzero * 10.0 ** (5 - np.floor(np.log10(nonzero)))
+    return bool((np.abs(scaled - np.round(scaled)) < 1e-6).all())
+
+def load_dataset(file_path: str, file_extension: str) -> pd.DataFrame:
+    """
+    Parse an uploaded file once, using the pyarrow CSV engine when available.
+    Floats are read as float64; compact_dtypes downcasts them after checking
+    every value, so no precision is lost at parse time.
+    """
+    if file_extension == 'json':
+        return pd.read_json(file_path)
+    if file_extension != 'csv':
+        return pd.read_excel(file_path)
+    if pa is None:
+        return pd.read_csv(file_path)
+    
+    # Multi-threaded arrow parse; self_destruct frees arrow buffers while converting
+    table = pa_csv.read_csv(file_path)
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+def process_uploaded_file(file_path: str, file_extension: str, target_column: str,
+                          df: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, pd.Series]:
+    """Process uploaded file and extract X, y (pass df to reuse an already parsed frame)"""
     try:
         # Load dataset
-        if file_extension == 'csv':
-            df = pd.read_csv(file_path)
-        elif file_extension == 'json':
-            df = pd.read_json(file_path)
-        else:
-            df = pd.read_excel(file_path)
+        if df is None:
+            df = load_dataset(file_path, file_extension)
         
         # Validate target column
         if target_column not in df.columns:
@@ -37,6 +72,7 @@ def process_uploaded_file(file_path: str, file_extension: str, target_column: st
         # Clean data
         X = remove_constant_features(X)
         X, y = handle_missing_values(X, y)
+        X = compact_dtypes(X)
         
         print(f"Dataset processed: {X.shape[0]} samples, {X.shape[1]} features")
         return X, y
@@ -45,27 +81,41 @@ def process_uploaded_file(file_path: str, file_extension: str, target_column: st
         print(f"Error processing file: {str(e)}")
         raise
 
-def remove_constant_features(X: pd.DataFrame) -> pd.DataFrame:
+def _constant_column_masks(values: np.ndarray, n_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Constant and quasi-constant (>99% one value) masks for the columns of a 2-D float array"""
+    if values.shape[0] == 0:
+        return np.ones(values.shape[1], dtype=bool), np.zeros(values.shape[1], dtype=bool)
+    # fmin/fmax skip NaN; all-NaN columns compare False and count as constant, like nunique() == 0
+    constant = ~(np.fmax.reduce(values, axis=0) > np.fmin.reduce(values, axis=0))
+    
+    # A value covering more than half of the non-missing entries is the median,
+    # so the top frequency is a comparison count instead of a value_counts per column
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        candidates = np.nanmedian(values, axis=0)
+    top_counts = (values == candidates).sum(axis=0)
+    return constant, top_counts / max(n_rows, 1) > 0.99
+
+def remove_constant_features(X: pd.DataFrame, block_size: int = 512) -> pd.DataFrame:
     """Remove constant and quasi-constant features"""
     if not isinstance(X, pd.DataFrame):
         X = pd.DataFrame(X)
-    # Remove constant features
-    constant_mask = X.nunique() <= 1
-    constant_features = X.columns[constant_mask]
-    if constant_features.any():
-        X = X.drop(columns=constant_features)
+    numeric = X.select_dtypes(include=[np.number, 'bool']).columns
+    other = X.columns.difference(numeric, sort=False)
     
-    # Remove quasi-constant features (99% same value)
-    quasi_constant = []
-    for col in X.columns:
-        if X[col].dtype in ['object', 'category']:
-            continue
-        if (X[col].value_counts().iloc[0] / len(X)) > 0.99:
-            quasi_constant.append(col)
+    drop = set()
+    # Numeric columns are checked in blocks to bound the temporary float64 copy
+    for start in range(0, len(numeric), block_size):
+        block = numeric[start:start + block_size]
+        constant, quasi_constant = _constant_column_masks(X[block].to_numpy(dtype=np.float64), len(X))
+        drop.update(block[constant | quasi_constant])
     
-    if quasi_constant:
-        X = X.drop(columns=quasi_constant)
+    # Object/category columns are only checked for being constant
+    if len(other):
+        drop.update(other[X[other].nunique().to_numpy() <= 1])
     
+    if drop:
+        X = X.drop(columns=[col for col in X.columns if col in drop])
     return X
 
 def handle_missing_values(X: pd.DataFrame, y: pd.Series) -> Tuple[pd.DataFrame, pd.Series]:
@@ -80,21 +130,80 @@ def handle_missing_values(X: pd.DataFrame, y: pd.Series) -> Tuple[pd.DataFrame,
         X = X[~missing_target]
         y = y[~missing_target]
     
-    if isinstance(X, pd.DataFrame):
-        missing_features = X.isna().sum()
-        if missing_features.any():
-            # Handle missing features
-            for col in X.columns:
-                if X[col].isna().any():
-                    if X[col].dtype in ['object', 'category']:
-                        X[col] = X[col].fillna(X[col].mode()[0] if not X[col].mode().empty else 'missing')
-                    else:
-                        X[col] = X[col].fillna(X[col].median())
+    missing = X.isna().any()
+    if missing.any():
+        columns = missing.index[missing]
+        categorical = X[columns].select_dtypes(include=['object', 'category']).columns
+        numeric = columns.difference(categorical, sort=False)
+        
+        # Bulk median fill per dtype block of numeric columns
+        filled = []
+        if len(numeric):
+            medians = X[numeric].median()
+            for dtype, cols in X[numeric].columns.groupby(X[numeric].dtypes).items():
+                values = X[cols].to_numpy()
+                values = np.where(np.isnan(values), medians[cols].to_numpy(dtype=dtype), values)
+                filled.append(pd.DataFrame(values, index=X.index, columns=cols))
+        
+        # A single mode lookup per categorical column
+        fill_values = {}
+        for col in categorical:
+            mode = X[col].mode()
+            fill_values[col] = mode.iloc[0] if not mode.empty else 'missing'
+        if fill_values:
+            filled.append(X[categorical].fillna(fill_values))
+        
+        X = pd.concat([X.drop(columns=columns)] + filled, axis=1)[X.columns]
     
     return X, y
 
+def _smallest_int_dtype(low: int, high: int) -> np.dtype:
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+def compact_dtypes(X: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink the working set of a cleaned feature frame.
+
+    float64 columns become float32 when all of their values keep the same
+    decimal representation, integers take the smallest signed type that holds
+    their range, and object/category/bool columns are encoded once into integer
+    codes. The memory before and after is recorded in X.attrs['compaction'].
+    """
+    memory_before = X.memory_usage(deep=True).sum()
+    X = X.copy(deep=False)
+    encoded = []
+    for col in X.columns:
+        values = X[col]
+        if pd.api.types.is_bool_dtype(values):
+            X[col] = values.astype(np.int8)
+        elif pd.api.types.is_float_dtype(values):
+            if values.dtype == np.float64 and _float32_is_safe(values):
+                X[col] = values.astype(np.float32)
+        elif pd.api.types.is_integer_dtype(values):
+            if len(values):
+                X[col] = values.astype(_smallest_int_dtype(values.min(), values.max()))
+        else:
+            # Object / category: integer codes in order of first appearance (NaN -> -1)
+            codes = pd.factorize(values)[0]
+            X[col] = codes.astype(_smallest_int_dtype(-1, codes.max(initial=0)))
+            encoded.append(str(col))
+    
+    memory_after = X.memory_usage(deep=True).sum()
+    X.attrs['compaction'] = {
+        'memory_before_mb': round(memory_before / 1024 / 1024, 2),
+        'memory_saved_mb': round((memory_before - memory_after) / 1024 / 1024, 2),
+        'encoded_columns': encoded
+    }
+    return X
+
 def get_dataset_stats(X: pd.DataFrame, y: pd.Series) -> Dict[str, Any]:
     """Get dataset statistics"""
+    if isinstance(X, StreamingDatasetStats):
+        return X.to_dataset_stats()
     if not isinstance(X, pd.DataFrame):
         X = pd.DataFrame(X)
     if not isinstance(y, pd.Series):
@@ -118,12 +227,16 @@ def get_dataset_stats(X: pd.DataFrame, y: pd.Series) -> Dict[str, Any]:
         stats['memory_usage_mb'] = round(X.memory_usage(deep=True).sum() / 1024 / 1024, 2)
     except:
         stats['memory_usage_mb'] = 0.0
+    compaction = X.attrs.get('compaction')
+    if compaction:
+        stats['memory_saved_mb'] = compaction['memory_saved_mb']
+        stats['encoded_columns'] = compaction['encoded_columns']
     
     # Feature correlations
     numerical_features = X.select_dtypes(include=[np.number]).columns
     if len(numerical_features) > 0:
         try:
-            correlations = X[numerical_features].corrwith(y).abs()
+            correlations = correlation_with_target(X[numerical_features], y).abs()
             stats['avg_feature_correlation'] = round(correlations.mean(), 4)
             stats['max_feature_correlation'] = round(correlations.max(), 4)
         except:
@@ -0,0 +1,181 @@
+import os
+import time
+import atexit
+import uuid
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+from app.utils.fitness import CorrelationFitness
+from app.utils.dataset_store import save_dataset_store, open_dataset_store, remove_dataset_store
+
+
+def compute_dataset_id(file, target_column: str) -> str:
+    """Content hash of an uploaded file stream combined with the target column"""
+    digest = hashlib.sha256()
+    file.stream.seek(0)
+    for chunk in iter(lambda: file.stream.read(1024 * 1024), b''):
+        digest.update(chunk)
+    file.stream.seek(0)
+    digest.update(b'\0' + str(target_column).encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
+class DatasetCache:
+    """
+    In-memory cache of cleaned datasets keyed by content hash.
+    
+    Each entry keeps X, y, the dataset statistics and, once built, the
+    correlation fitness engine. Entries expire after `ttl_seconds` and the
+    least recently used ones are evicted beyond `max_entries` or `max_memory_mb`.
+    
+    With `store_dir` set, each cleaned dataset is also written to a
+    memory-mapped column store there and X, y are served from it, so worker
+    processes can open the same pages instead of receiving a pickled copy.
+    Runs that hand a store path to workers pin it with acquire_store(); an
+    evicted or replaced store is only deleted once its last pin is released.
+    """
+    
+    def __init__(self, max_entries: int = 8, max_memory_mb: float = 512, ttl_seconds: float = 1800,
+                 store_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.max_memory_mb = max_memory_mb
+        self.ttl_seconds = ttl_seconds
+        self.store_dir = store_dir
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Pin counts per store path, and pinned stores already dropped from the cache
+        self._pins = {}
+        self._retired = set()
+        if store_dir:
+            # Stores only live as long as the cache that indexes them
+            atexit.register(self.clear)
+    
+    def _entry_nbytes(self, entry: Dict[str, Any]) -> int:
+        nbytes = int(entry['X'].memory_usage(deep=True).sum())
+        nbytes += int(getattr(entry['y'], 'nbytes', 0))
+        engine = entry.get('fitness_engine')
+        if engine is not None:
+            arrays, _ = engine.to_arrays()
+            nbytes += sum(array.nbytes for array in arrays.values())
+        return nbytes
+    
+    def _evict(self):
+        now = time.time()
+        for dataset_id in [key for key, entry in self._entries.items()
+                           if now - entry['created_at'] > self.ttl_seconds]:
+            self._drop(self._entries.pop(dataset_id))
+        
+        max_bytes = self.max_memory_mb * 1024 * 1024
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or sum(entry['nbytes'] for entry in self._entries.values()) > max_bytes
+        ):
+            self._drop(self._entries.popitem(last=False)[1])
+    
+    def _drop(self, entry: Dict[str, Any]):
+        if entry.get('store_path'):
+            self._remove_store(entry['store_path'])
+            entry['store_path'] = None
+    
+    def _remove_store(self, path: str):
+        """Delete a store now, or when the last pending run using it releases it"""
+        if self._pins.get(path):
+            self._retired.add(path)
+        else:
+            remove_dataset_store(path)
+    
+    def _persist(self, entry: Dict[str, Any]):
+        """Write X, y to a store and swap them for memory-mapped views"""
+        if not self.store_dir:
+            return
+        path = os.path.join(self.store_dir, f"{entry['dataset_id']}_{uuid.uuid4().hex[:8]}")
+        try:
+            save_dataset_store(path, entry['X'], entry['y'], entry['target_column'])
+        except (ValueError, OSError) as e:
+            print(f"Dataset store skipped for {entry['dataset_id']}: {e}")
+            remove_dataset_store(path)
+            return
+        entry['X'], entry['y'] = open_dataset_store(path)
+        entry['store_path'] = path
+    
+    def get(self, dataset_id: str) -> Optional[Dict[str, Any]]:
+        """Return a cached entry, or None if it is missing or expired"""
+        with self._lock:
+            self._evict()
+            entry = self._entries.get(dataset_id)
+            if entry is not None:
+                self._entries.move_to_end(dataset_id)
+            return entry
+    
+    def put(self, dataset_id: str, X, y, dataset_stats: Dict[str, Any], target_column: str) -> Dict[str, Any]:
+        entry = {
+            'dataset_id': dataset_id,
+            'X': X,
+            'y': y,
+            'dataset_stats': dataset_stats,
+            'target_column': target_column,
+            'created_at': time.time(),
+            'fitness_engine': None,
+            'store_path': None
+        }
+        self._persist(entry)
+        entry['nbytes'] = self._entry_nbytes(entry)
+        with self._lock:
+            previous = self._entries.pop(dataset_id, None)
+            if previous is not None:
+                self._drop(previous)
+            self._entries[dataset_id] = entry
+            self._evict()
+        return entry
+    
+    def get_fitness_engine(self, entry: Dict[str, Any]):
+        """Correlation fitness engine for a cached dataset, built on first use"""
+        if entry['fitness_engine'] is None:
+            engine = CorrelationFitness(entry['X'], entry['y'])
+            with self._lock:
+                if entry['fitness_engine'] is None:
+                    entry['fitness_engine'] = engine
+                    entry['nbytes'] = self._entry_nbytes(entry)
+                    self._evict()
+        return entry['fitness_engine']
+    
+    def acquire_store(self, entry: Dict[str, Any]) -> Optional[str]:
+        """Pin the entry's current store for workers; None if it has none (or was already evicted)"""
+        with self._lock:
+            path = entry.get('store_path')
+            if path:
+                self._pins[path] = self._pins.get(path, 0) + 1
+            return path
+    
+    def release_store(self, path: Optional[str]):
+        """Undo acquire_store(); a store dropped from the cache meanwhile is deleted with its last pin"""
+        if not path:
+            return
+        with self._lock:
+            self._pins[path] -= 1
+            if self._pins[path] == 0:
+                del self._pins[path]
+                if path in self._retired:
+                    self._retired.discard(path)
+                    remove_dataset_store(path)
+    
+    @contextmanager
+    def pinned_store(self, entry: Dict[str, Any]):
+        """acquire_store() for the duration of a block"""
+        path = self.acquire_store(entry)
+        try:
+            yield path
+        finally:
+            self.release_store(path)
+    
+    def clear(self):
+        with self._lock:
+            for entry in self._entries.values():
+                self._drop(entry)
+            self._entries.clear()
+            # Called at exit: pinned stores go too
+            for path in self._retired:
+                remove_dataset_store(path)
+            self._retired.clear()
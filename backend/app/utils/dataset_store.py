@@ -0,0 +1,84 @@
+import os
+import json
+import shutil
+import numpy as np
+import pandas as pd
+from typing import Tuple, Dict, Any, List
+
+FEATURES_FILE = 'features_{}.npy'
+TARGET_FILE = 'target.npy'
+META_FILE = 'meta.json'
+
+
+def _dtype_runs(X: pd.DataFrame) -> List[Tuple[np.dtype, List[str]]]:
+    """Consecutive columns sharing a NumPy dtype (extension dtypes are stored as float64)"""
+    runs = []
+    for col, dtype in X.dtypes.items():
+        dtype = dtype if isinstance(dtype, np.dtype) else np.dtype(np.float64)
+        if runs and runs[-1][0] == dtype:
+            runs[-1][1].append(col)
+        else:
+            runs.append((dtype, [col]))
+    return runs
+
+
+def save_dataset_store(directory: str, X: pd.DataFrame, y, target_column: str = None) -> str:
+    """
+    Persist a cleaned dataset as a column-major NumPy store.
+
+    Layout: one features_<i>.npy per run of consecutive columns with the same
+    dtype (Fortran-ordered, so each column is contiguous, and kept at the
+    compacted dtype), target.npy and a meta.json sidecar with column names,
+    the blocks and the target encoding. Raises ValueError for non-numeric
+    feature columns.
+    """
+    non_numeric = [c for c in X.columns if not pd.api.types.is_numeric_dtype(X[c])]
+    if non_numeric:
+        raise ValueError(f"Dataset store needs numeric features, got: {non_numeric}")
+
+    os.makedirs(directory, exist_ok=True)
+    blocks = []
+    for i, (dtype, columns) in enumerate(_dtype_runs(X)):
+        np.save(os.path.join(directory, FEATURES_FILE.format(i)),
+                np.asfortranarray(X[columns].to_numpy(dtype=dtype)))
+        blocks.append({'columns': [str(c) for c in columns], 'dtype': dtype.name})
+    target = np.asarray(y)
+    np.save(os.path.join(directory, TARGET_FILE), target)
+
+    meta = {
+        'columns': [str(c) for c in X.columns],
+        'n_samples': int(len(X)),
+        'blocks': blocks,
+        'target_column': target_column,
+        'target_dtype': target.dtype.name,
+        'target_classes': np.unique(target).tolist() if target.dtype.kind in 'iub' else None
+    }
+    # The sidecar is written last, so its presence marks a complete store
+    with open(os.path.join(directory, META_FILE), 'w') as f:
+        json.dump(meta, f)
+    return directory
+
+
+def read_store_meta(directory: str) -> Dict[str, Any]:
+    with open(os.path.join(directory, META_FILE)) as f:
+        return json.load(f)
+
+
+def open_dataset_store(directory: str, mmap_mode: str = 'r') -> Tuple[pd.DataFrame, pd.Series]:
+    """Open a dataset store as X, y backed by the memory-mapped files (no copy)"""
+    meta = read_store_meta(directory)
+    # Blocks cover consecutive columns, so concatenating them keeps the column order; each block
+    # stays memory-mapped unless pandas consolidates runs of the same dtype that are not adjacent
+    X = pd.concat([
+        pd.DataFrame(np.load(os.path.join(directory, FEATURES_FILE.format(i)), mmap_mode=mmap_mode),
+                     columns=block['columns'], copy=False)
+        for i, block in enumerate(meta['blocks'])
+    ], axis=1, copy=False)
+    target = np.load(os.path.join(directory, TARGET_FILE), mmap_mode=mmap_mode)
+    y = pd.Series(target, name=meta['target_column'], copy=False)
+    return X, y
+
+
+def remove_dataset_store(directory: str):
+    """Delete a store; processes that already mapped it keep their view"""
+    shutil.rmtree(directory, ignore_errors=True)
@@ -1,7 +1,9 @@
 import numpy as np
 import pandas as pd
 import logging
-from typing import List, Dict, Any
+from scipy import sparse
+from typing import List, Dict, Any, Tuple
+from app.utils.correlation_stats import CorrelationStats
 
 def calculate_fitness(selected_features: list, X: pd.DataFrame, y: pd.Series) -> float:
     """
@@ -25,4 +27,160 @@ def calculate_fitness(selected_features: list, X: pd.DataFrame, y: pd.Series) ->
     
     # Penalty and final score
     penalty = (k / X.shape[1]) * 0.1
-    return max(0.0, relevance - redundancy - penalty)
\ No newline at end of file
+    return max(0.0, relevance - redundancy - penalty)
+
+
+class CorrelationFitness:
+    """
+    Correlation fitness engine with precomputed correlations.
+
+    |corr(X)| and |corr(X, y)| are derived once per dataset from
+    CorrelationStats, so scoring an individual is a lookup into those arrays
+    instead of a pass over the rows. Scores match calculate_fitness for the
+    same selection.
+    """
+
+    def __init__(self, X: pd.DataFrame, y: pd.Series):
+        self._set_stats(CorrelationStats.from_frame(X, y))
+
+    def _set_stats(self, stats):
+        self.stats = stats
+        self.columns = stats.columns
+        self.n_total_features = len(stats.columns)
+        feature_corr, target_corr = stats.correlations()
+        self.target_corr = np.abs(target_corr)
+        self.feature_corr = np.abs(feature_corr)
+        np.fill_diagonal(self.feature_corr, 0)
+
+        # NaN-free copies for the batched path; undefined correlations are tracked separately
+        self._target_nan = np.isnan(self.target_corr)
+        self._feature_nan = np.isnan(self.feature_corr)
+        self._target_corr = np.where(self._target_nan, 0.0, self.target_corr)
+        self._feature_corr = np.where(self._feature_nan, 0.0, self.feature_corr)
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """Arrays and parameters needed to rebuild the engine in another process"""
+        arrays = {
+            'target_corr': self.target_corr,
+            'feature_corr': self.feature_corr,
+            'target_nan': self._target_nan,
+            'feature_nan': self._feature_nan,
+            'target_corr_filled': self._target_corr,
+            'feature_corr_filled': self._feature_corr,
+        }
+        return arrays, {'columns': list(self.columns)}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], columns: List[str]) -> 'CorrelationFitness':
+        """Rebuild an engine from to_arrays() output without recomputing anything"""
+        engine = cls.__new__(cls)
+        engine.stats = None
+        engine.columns = pd.Index(columns)
+        engine.n_total_features = len(columns)
+        engine.target_corr = arrays['target_corr']
+        engine.feature_corr = arrays['feature_corr']
+        engine._target_nan = arrays['target_nan']
+        engine._feature_nan = arrays['feature_nan']
+        engine._target_corr = arrays['target_corr_filled']
+        engine._feature_corr = arrays['feature_corr_filled']
+        return engine
+
+    @classmethod
+    def from_stats(cls, stats) -> 'CorrelationFitness':
+        """Build an engine from CorrelationStats (or streamed dataset statistics)"""
+        engine = cls.__new__(cls)
+        engine._set_stats(getattr(stats, 'moments', stats))
+        return engine
+
+    def score(self, mask: np.ndarray) -> float:
+        """Score a single boolean feature mask"""
+        idx = np.flatnonzero(mask)
+        k = len(idx)
+        if k == 0:
+            return 0.0
+        
+        # Relevance
+        relevance = np.mean(self.target_corr[idx])
+        
+        # Redundancy
+        redundancy = 0.0
+        if k > 1:
+            redundancy = self.feature_corr[np.ix_(idx, idx)].sum() / (k * (k - 1))
+        
+        # Penalty and final score
+        penalty = (k / self.n_total_features) * 0.1
+        return max(0.0, relevance - redundancy - penalty)
+
+    @property
+    def has_undefined(self) -> bool:
+        """True if any correlation is NaN (e.g. a constant column)"""
+        return bool(self._target_nan.any() or self._feature_nan.any())
+
+    def population_sums(self, masks: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Running sums behind the score of each row: selected count k, relevance
+        sum, pair (redundancy) sum, and the gradient |corr| @ mask that lets
+        the pair sum be updated when genes flip.
+        """
+        selected = np.asarray(masks, dtype=bool).astype(float)
+        gradient = selected @ self._feature_corr
+        return {
+            'k': selected.sum(axis=1),
+            'relevance': selected @ self._target_corr,
+            'pairs': (gradient * selected).sum(axis=1),
+            'gradient': gradient,
+        }
+
+    def update_sums(self, sums: Dict[str, np.ndarray], diffs: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Sums for rows that differ from the rows in `sums` by `diffs` (+1 for an
+        added gene, -1 for a removed one), in O(flips * n_features) per row.
+
+        With d the diff and g = C m, the new pair sum is
+        m'Cm' = mCm + 2 d.g + d.(C d), and the new gradient is g + C d.
+        """
+        flips = sparse.csr_matrix(diffs, dtype=float)
+        delta_gradient = flips @ self._feature_corr
+        return {
+            'k': sums['k'] + np.asarray(flips.sum(axis=1)).ravel(),
+            'relevance': sums['relevance'] + flips @ self._target_corr,
+            'pairs': sums['pairs']
+                     + 2 * np.asarray(flips.multiply(sums['gradient']).sum(axis=1)).ravel()
+                     + np.asarray(flips.multiply(delta_gradient).sum(axis=1)).ravel(),
+            'gradient': sums['gradient'] + delta_gradient,
+        }
+
+    def score_sums(self, sums: Dict[str, np.ndarray]) -> np.ndarray:
+        """Scores from population_sums/update_sums output (no undefined-correlation handling)"""
+        k = sums['k']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Relevance: mean |corr(f, y)| over the selected features
+            relevance = sums['relevance'] / k
+
+            # Redundancy: sum of |corr| over selected pairs, i.e. the row-wise quadratic form
+            redundancy = np.where(k > 1, sums['pairs'] / (k * (k - 1)), 0.0)
+
+        # Penalty and final score
+        penalty = (k / self.n_total_features) * 0.1
+        scores = np.maximum(0.0, relevance - redundancy - penalty)
+        scores[k == 0] = 0.0
+        return scores
+
+    def score_population(self, masks: np.ndarray) -> np.ndarray:
+        """
+        Score a (population_size, n_features) boolean matrix in one batch
+        """
+        masks = np.asarray(masks, dtype=bool)
+        selected = masks.astype(float)
+        k = selected.sum(axis=1)
+        scores = self.score_sums(self.population_sums(masks))
+
+        # Selections touching an undefined correlation score 0, as in score()
+        undefined = k == 0
+        if self._target_nan.any():
+            undefined |= (selected @ self._target_nan) > 0
+        if self._feature_nan.any():
+            undefined |= ((selected @ self._feature_nan) * selected).sum(axis=1) > 0
+        scores[undefined] = 0.0
+
+        return scores
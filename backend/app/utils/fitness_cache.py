@@ -0,0 +1,80 @@
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, Any
+
+
+def chromosome_key(mask: np.ndarray) -> bytes:
+    """Compact hashable key for a boolean chromosome"""
+    return np.packbits(np.asarray(mask, dtype=bool)).tobytes()
+
+
+class FitnessCache:
+    """Bounded LRU cache of fitness scores keyed by packed chromosome bits"""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._scores = OrderedDict()
+
+    def __len__(self):
+        return len(self._scores)
+
+    def get(self, key: bytes):
+        """Return the cached score or None, updating the hit/miss counters"""
+        if key in self._scores:
+            self._scores.move_to_end(key)
+            self.hits += 1
+            return self._scores[key]
+        self.misses += 1
+        return None
+
+    def peek(self, key: bytes):
+        """Return the cached score or None without touching the counters or LRU order"""
+        return self._scores.get(key)
+
+    def put(self, key: bytes, score: float):
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        while len(self._scores) > self.max_size:
+            self._scores.popitem(last=False)
+
+    def score_population(self, masks: np.ndarray, evaluate) -> np.ndarray:
+        """
+        Score a population matrix, calling evaluate() only on unseen rows.
+        Identical rows within the batch are evaluated once.
+        """
+        scores = np.empty(len(masks), dtype=float)
+        pending = {}
+
+        for i, row in enumerate(np.packbits(masks, axis=1)):
+            key = row.tobytes()
+            if key in pending:
+                # Duplicate of a row already queued in this batch
+                self.hits += 1
+                pending[key].append(i)
+                continue
+            cached = self.get(key)
+            if cached is None:
+                pending[key] = [i]
+            else:
+                scores[i] = cached
+
+        if pending:
+            rows = [indices[0] for indices in pending.values()]
+            new_scores = evaluate(masks[rows])
+            for (key, indices), score in zip(pending.items(), new_scores):
+                scores[indices] = score
+                self.put(key, float(score))
+
+        return scores
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'max_size': self.max_size,
+            'size': len(self._scores),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+        }
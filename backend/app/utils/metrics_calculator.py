@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import logging
 from typing import Dict,  List
+from app.utils.correlation_stats import CorrelationStats
 
 
 def _safe_calculate_metrics(func, X, selected_features, default_value):
@@ -12,13 +13,20 @@ def _safe_calculate_metrics(func, X, selected_features, default_value):
         print(f"Error in {func.__name__}: {e}")
         return default_value
 
+def _selected_stats(X, selected_features: List[str]) -> CorrelationStats:
+    """Correlation statistics for the selected columns of X (a DataFrame or existing statistics)"""
+    selected = X[selected_features]
+    if isinstance(selected, CorrelationStats):
+        return selected
+    return CorrelationStats.from_frame(selected)
+
 def calculate_redundancy_rate(X: pd.DataFrame, selected_features: List[str]) -> float:
     """Calculate Redundancy Rate - average correlation between selected features"""
     if len(selected_features) <= 1:
         return 0.0
     
     # Calculate correlation matrix for selected features
-    corr_matrix = X[selected_features].corr().abs()
+    corr_matrix = _selected_stats(X, selected_features).corr().abs()
     
     # Get upper triangle without diagonal
     mask = np.triu(np.ones_like(corr_matrix, dtype=bool), k=1)
@@ -34,7 +42,7 @@ def calculate_representation_entropy(X: pd.DataFrame, selected_features: List[st
         return 0.0
     
     # Use variance as proxy for feature importance
-    variances = X[selected_features].var()
+    variances = _selected_stats(X, selected_features).var()
     
     # Normalize to create probability distribution
     total_variance = variances.sum()
@@ -0,0 +1,181 @@
+import os
+import atexit
+import itertools
+import multiprocessing
+import shutil
+import tempfile
+import threading
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+# Fitness engine rebuilt once per worker process by _init_worker
+_worker_engine = None
+
+# Modules the forkserver imports once, so each forked worker starts with them loaded
+FORKSERVER_PRELOAD = ['app.services.ga_service', 'app.services.traditional_service']
+
+# Process pool shared by the request-level fan-out (compare, sweep), started on first use
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """Translate a joblib-style n_jobs value into a worker count"""
+    cpu_count = os.cpu_count() or 1
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, cpu_count + 1 + n_jobs)
+    return min(n_jobs, cpu_count)
+
+
+def pool_context():
+    """
+    Start method for worker pools. Pools are started from request threads,
+    and fork would copy locks other threads hold at that moment, so workers
+    come from a forkserver (spawn where that is unavailable).
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload(FORKSERVER_PRELOAD)
+    return context
+
+
+def save_shared_arrays(directory: str, arrays: Dict[str, np.ndarray]) -> Dict[str, str]:
+    """Write arrays as .npy files that worker processes can memory-map"""
+    array_paths = {}
+    for name, array in arrays.items():
+        path = os.path.join(directory, f"{name}.npy")
+        np.save(path, np.ascontiguousarray(array))
+        array_paths[name] = path
+    return array_paths
+
+
+def load_shared_arrays(array_paths: Dict[str, str]) -> Dict[str, np.ndarray]:
+    return {name: np.load(path, mmap_mode='r') for name, path in array_paths.items()}
+
+
+def share_engine(engine, directory: str):
+    """Picklable (engine class, array paths, params) handle that rebuilds `engine` from memory-mapped files"""
+    arrays, params = engine.to_arrays()
+    return type(engine), save_shared_arrays(directory, arrays), params
+
+
+def load_shared_engine(shared):
+    """Rebuild an engine from a share_engine() handle without copying its arrays"""
+    engine_cls, array_paths, params = shared
+    return engine_cls.from_arrays(load_shared_arrays(array_paths), **params)
+
+
+@contextmanager
+def shared_engine_files(engine):
+    """Share an engine through a temporary directory for the duration of the block (None passes through)"""
+    if engine is None:
+        yield None
+        return
+    directory = tempfile.mkdtemp(prefix='ga_engine_')
+    try:
+        yield share_engine(engine, directory)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def get_shared_pool() -> ProcessPoolExecutor:
+    """The process pool shared by concurrent method runs, one per web process and sized to the cores"""
+    global _shared_pool
+    with _shared_pool_lock:
+        # A pool whose worker died cannot take new tasks, so it is replaced
+        if _shared_pool is None or _shared_pool._broken:
+            _shared_pool = ProcessPoolExecutor(max_workers=resolve_n_jobs(-1), mp_context=pool_context())
+            atexit.register(_shared_pool.shutdown, wait=False, cancel_futures=True)
+        return _shared_pool
+
+
+def run_in_shared_pool(fn: Callable, calls: Dict[Any, tuple], max_workers: int) -> Dict[Any, Any]:
+    """
+    Run fn(*args) for every entry of `calls` on the shared pool, at most
+    max_workers at a time, and return the results by key. On a failure the
+    calls not yet started are dropped and the running ones awaited before
+    the error is raised.
+    """
+    executor = get_shared_pool()
+    queued = iter(calls.items())
+    running = {}
+    results = {}
+    try:
+        for key, args in itertools.islice(queued, max_workers):
+            running[executor.submit(fn, *args)] = key
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+                for key, args in itertools.islice(queued, 1):
+                    running[executor.submit(fn, *args)] = key
+    except BaseException:
+        for future in running:
+            future.cancel()
+        wait(running)
+        raise
+    return {key: results[key] for key in calls}
+
+
+def _init_worker(engine_cls, array_paths, params):
+    """Open the shared arrays read-only and rebuild the fitness engine"""
+    global _worker_engine
+    _worker_engine = engine_cls.from_arrays(load_shared_arrays(array_paths), **params)
+
+
+def _score_chunk(masks):
+    return _worker_engine.score_population(masks)
+
+
+class ParallelFitnessEvaluator:
+    """
+    Spread population scoring over a process pool.
+
+    The engine's arrays are written once to .npy files and memory-mapped by
+    every worker, so only the population chunks are pickled per task.
+    Use as a context manager so the pool and the files are cleaned up.
+    """
+
+    def __init__(self, engine, n_jobs: int = -1):
+        self.engine = engine
+        self.n_workers = resolve_n_jobs(n_jobs)
+        self._executor = None
+        self._shared_dir = None
+
+    def __enter__(self):
+        self._shared_dir = tempfile.mkdtemp(prefix='ga_shared_')
+        arrays, params = self.engine.to_arrays()
+        array_paths = save_shared_arrays(self._shared_dir, arrays)
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            mp_context=pool_context(),
+            initializer=_init_worker,
+            initargs=(type(self.engine), array_paths, params)
+        )
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._shared_dir is not None:
+            shutil.rmtree(self._shared_dir, ignore_errors=True)
+            self._shared_dir = None
+
+    def score_population(self, masks: np.ndarray) -> np.ndarray:
+        """Score the population in one chunk per worker"""
+        if self._executor is None:
+            return self.engine.score_population(masks)
+
+        chunks = [chunk for chunk in np.array_split(masks, self.n_workers) if len(chunk)]
+        return np.concatenate(list(self._executor.map(_score_chunk, chunks)))
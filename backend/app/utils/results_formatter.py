@@ -28,7 +28,8 @@ def format_selection_results(
     method: str,
     selected_features: List[str],
     X: Any,
-    additional_params: Dict[str, Any] = None
+    additional_params: Dict[str, Any] = None,
+    diagnostics: Dict[str, Any] = None
 ) -> Dict[str, Any]:
     """
     Format feature selection results
@@ -57,6 +58,10 @@ def format_selection_results(
         if additional_params:
             results['parameters_used'] = convert_to_serializable(additional_params)
         
+        # Add run diagnostics (evaluation counts, cache statistics, ...) if provided
+        if diagnostics:
+            results['diagnostics'] = convert_to_serializable(diagnostics)
+        
         return convert_to_serializable(results)
         
     except Exception as e:
@@ -0,0 +1,222 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List
+from app.utils.correlation_stats import CorrelationStats
+
+
+class StreamingDatasetStats:
+    """
+    Sufficient statistics of a dataset accumulated chunk by chunk.
+
+    Holds CorrelationStats over [features, target] (merged chunk by chunk),
+    exact min/max, missing-value counts, and a fixed-size row reservoir used
+    for approximate medians and value frequencies. Memory is bounded by the
+    number of columns and the reservoir size, not by the number of rows.
+
+    Supports the read-only calls the selectors and metrics make on X
+    (shape, columns, stats[cols].corr(), stats[cols].var()).
+    """
+
+    def __init__(self, columns: List[str], reservoir_size: int = 10000, random_state: int = 42):
+        self.columns = pd.Index(columns)
+        self.categorical_columns = []
+        self.reservoir_size = reservoir_size
+        self.n_chunks = 0
+        self.rows_dropped = 0
+        self.target_counts = {}
+        self._target_codes = None
+        self._rng = np.random.default_rng(random_state)
+
+        n_cols = len(columns)
+        self.n_seen = 0
+        self.missing_counts = np.zeros(n_cols, dtype=np.int64)
+        self.minimums = np.full(n_cols, np.inf)
+        self.maximums = np.full(n_cols, -np.inf)
+        self._reservoir = np.empty((0, n_cols))
+        self.reset_moments()
+
+    # ----- accumulation -----
+
+    def reset_moments(self):
+        """Clear the moment accumulators (used before a second, imputing pass)"""
+        self.moments = CorrelationStats(self.columns, has_target=True)
+
+    def encode_target(self, y: pd.Series) -> np.ndarray:
+        """Encode the target consistently across chunks (numeric as-is, others by first appearance)"""
+        if self._target_codes is None:
+            self._target_codes = {} if y.dtype == 'object' else False
+        if self._target_codes is False:
+            return y.to_numpy(dtype=float)
+        for value in pd.unique(y):
+            self._target_codes.setdefault(value, len(self._target_codes))
+        return y.map(self._target_codes).to_numpy(dtype=float)
+
+    def update_columns(self, values: np.ndarray):
+        """Missing counts, min/max and the row reservoir for one chunk of feature values"""
+        missing = np.isnan(values)
+        self.missing_counts += missing.sum(axis=0)
+        if len(values):
+            with np.errstate(invalid='ignore'):
+                self.minimums = np.fmin(self.minimums, np.nanmin(np.where(missing, np.inf, values), axis=0))
+                self.maximums = np.fmax(self.maximums, np.nanmax(np.where(missing, -np.inf, values), axis=0))
+
+        # Vectorized reservoir sampling (Algorithm R) over the chunk rows
+        n_rows = len(values)
+        free = max(0, min(self.reservoir_size - len(self._reservoir), n_rows))
+        if free:
+            self._reservoir = np.vstack([self._reservoir, values[:free]])
+        if free < n_rows:
+            seen = self.n_seen + np.arange(free, n_rows)
+            slots = self._rng.integers(0, seen + 1)
+            keep = slots < self.reservoir_size
+            self._reservoir[slots[keep]] = values[free:][keep]
+        self.n_seen += n_rows
+
+    def update_moments(self, values: np.ndarray, target: np.ndarray):
+        """Merge one complete (no missing values) chunk into the correlation statistics"""
+        self.moments.update(values, target)
+
+    # ----- derived statistics -----
+
+    @property
+    def n_samples(self) -> int:
+        return self.moments.n_samples
+
+    @property
+    def shape(self):
+        return (self.n_samples, len(self.columns))
+
+    def __getitem__(self, columns):
+        if isinstance(columns, str):
+            columns = [columns]
+        return self.moments.subset(list(columns))
+
+    def medians(self) -> np.ndarray:
+        """Approximate medians from the row reservoir"""
+        if len(self._reservoir) == 0:
+            return np.full(len(self.columns), np.nan)
+        with np.errstate(all='ignore'):
+            return np.nanmedian(self._reservoir, axis=0)
+
+    def top_frequency_ratios(self) -> np.ndarray:
+        """Approximate share of the most frequent value per column, from the reservoir"""
+        ratios = np.zeros(len(self.columns))
+        if len(self._reservoir) == 0:
+            return ratios
+        for i in range(len(self.columns)):
+            column = self._reservoir[:, i]
+            _, counts = np.unique(column[~np.isnan(column)], return_counts=True)
+            ratios[i] = counts.max() / len(column) if len(counts) else 0.0
+        return ratios
+
+    def variances(self) -> np.ndarray:
+        return self.moments.variances()
+
+    def correlation_matrix(self) -> np.ndarray:
+        """Pearson correlation between features"""
+        return self.moments.correlation_matrix()
+
+    def target_correlation(self) -> np.ndarray:
+        """Pearson correlation of each feature with the target"""
+        return self.moments.target_correlation()
+
+    def select_columns(self, keep: np.ndarray) -> 'StreamingDatasetStats':
+        """Drop columns in place (keep is a boolean mask over the current columns)"""
+        self.moments = self.moments.subset(list(self.columns[keep]))
+        self.columns = self.columns[keep]
+        self.missing_counts = self.missing_counts[keep]
+        self.minimums = self.minimums[keep]
+        self.maximums = self.maximums[keep]
+        self._reservoir = self._reservoir[:, keep]
+        return self
+
+    def constant_feature_mask(self, threshold: float = 0.99) -> np.ndarray:
+        """Constant columns (exact min == max) and quasi-constant ones (approximate top-frequency ratio)"""
+        constant = ~(self.maximums > self.minimums)
+        return constant | (self.top_frequency_ratios() > threshold)
+
+    def to_dataset_stats(self) -> Dict[str, Any]:
+        """Statistics in the same shape as data_processor.get_dataset_stats"""
+        correlations = np.abs(self.target_correlation())
+        valid = correlations[~np.isnan(correlations)]
+        nbytes = self.moments.comoment.nbytes + self.moments.mean.nbytes + self._reservoir.nbytes
+        return {
+            'samples': self.n_samples,
+            'features': len(self.columns),
+            'target_distribution': dict(self.target_counts),
+            'missing_values': 0,
+            'feature_types': {'numerical': len(self.columns), 'categorical': 0},
+            'memory_usage_mb': round(nbytes / 1024 / 1024, 2),
+            'avg_feature_correlation': round(float(valid.mean()), 4) if len(valid) else 0.0,
+            'max_feature_correlation': round(float(valid.max()), 4) if len(valid) else 0.0,
+            'streaming': {
+                'chunks': self.n_chunks,
+                'missing_values_imputed': int(self.missing_counts.sum()),
+                'rows_dropped_missing_target': self.rows_dropped,
+                'excluded_non_numeric_columns': list(self.categorical_columns),
+                'median_reservoir_size': len(self._reservoir)
+            }
+        }
+
+
+def stream_dataset_statistics(file_path: str, target_column: str, chunksize: int = 50000,
+                              reservoir_size: int = 10000, random_state: int = 42,
+                              quasi_constant_threshold: float = 0.99) -> StreamingDatasetStats:
+    """
+    Read a CSV in chunks and return its sufficient statistics without
+    materializing the full frame.
+
+    Mirrors process_uploaded_file: rows with a missing target are dropped,
+    constant and quasi-constant features are removed, and missing feature
+    values are imputed with (approximate) medians. A second pass over the
+    file is made only when there are missing values to impute.
+    """
+    header = pd.read_csv(file_path, nrows=100)
+    if target_column not in header.columns:
+        raise ValueError(f"Target column '{target_column}' not found")
+    features = header.drop(columns=[target_column])
+    numeric = features.select_dtypes(include=[np.number]).columns.tolist()
+    if len(numeric) < 2:
+        raise ValueError("Dataset must have at least 2 numeric features for streaming mode")
+
+    stats = StreamingDatasetStats(numeric, reservoir_size=reservoir_size, random_state=random_state)
+    stats.categorical_columns = [c for c in features.columns if c not in numeric]
+
+    def chunks():
+        for chunk in pd.read_csv(file_path, chunksize=chunksize):
+            present = chunk[target_column].notna()
+            values = chunk.loc[present, numeric].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+            yield chunk.loc[present, target_column], values, int((~present).sum())
+
+    # Pass 1: column statistics, target encoding and (if complete) moments
+    has_missing = False
+    for y_chunk, values, dropped in chunks():
+        target = stats.encode_target(y_chunk)
+        stats.update_columns(values)
+        stats.n_chunks += 1
+        stats.rows_dropped += dropped
+        codes, counts = np.unique(target, return_counts=True)
+        for code, count in zip(codes, counts):
+            stats.target_counts[code] = stats.target_counts.get(code, 0) + int(count)
+        has_missing = has_missing or bool(np.isnan(values).any())
+        if not has_missing:
+            stats.update_moments(values, target)
+
+    keep = ~stats.constant_feature_mask(quasi_constant_threshold)
+
+    # Pass 2: recompute moments with median imputation
+    if has_missing:
+        medians = stats.medians()
+        stats.reset_moments()
+        for y_chunk, values, _ in chunks():
+            values = np.where(np.isnan(values), medians, values)
+            stats.update_moments(values, stats.encode_target(y_chunk))
+
+    stats.select_columns(keep)
+    # Report target classes with plain Python keys, like value_counts in get_dataset_stats
+    stats.target_counts = {
+        (int(k) if float(k).is_integer() else float(k)): v for k, v in stats.target_counts.items()
+    }
+    print(f"Streamed dataset: {stats.n_samples} samples, {len(stats.columns)} features "
+          f"in {stats.n_chunks} chunks")
+    return stats
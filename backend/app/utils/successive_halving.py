@@ -0,0 +1,97 @@
+import math
+import time
+import numpy as np
+from typing import Dict, Any, List, Optional
+from app.utils.wrapper_fitness import WrapperFitness
+
+
+def halving_fractions(min_fraction: float, eta: int) -> List[float]:
+    """Row fractions per rung: min_fraction, min_fraction * eta, ... ending at the full data"""
+    if not 0 < min_fraction <= 1:
+        raise ValueError("halving_min_fraction must be in (0, 1]")
+    if eta < 2:
+        raise ValueError("halving_eta must be at least 2")
+    fractions = []
+    fraction = min_fraction
+    while fraction < 1.0:
+        fractions.append(round(fraction, 6))
+        fraction *= eta
+    return fractions + [1.0]
+
+
+class SuccessiveHalvingEvaluator:
+    """
+    Multi-fidelity scoring of a population with a wrapper fitness.
+
+    Every unseen chromosome is scored on the smallest row subsample; the top
+    1/eta move on to the next, larger subsample, and only the finalists get
+    CV on the full data. A chromosome's CV score is the one from the highest
+    rung it reached, capped so that it never exceeds the score of any
+    chromosome promoted past it. Chromosomes already scored on the full data
+    skip the rungs.
+    """
+
+    def __init__(self, engine: WrapperFitness, min_fraction: float = 0.1, eta: int = 3,
+                 fractions: Optional[List[float]] = None):
+        self.engine = engine
+        self.eta = eta
+        self.fractions = fractions or halving_fractions(min_fraction, eta)
+        self.columns = engine.columns
+        self.n_total_features = engine.n_total_features
+        self._rungs = [
+            {'fraction': fraction, 'rows': engine.rows_for(fraction),
+             'evaluated': 0, 'promoted': 0, 'model_fits': 0, 'seconds': 0.0}
+            for fraction in self.fractions
+        ]
+
+    @property
+    def target_corr(self) -> np.ndarray:
+        return self.engine.target_corr
+
+    def score_population(self, masks: np.ndarray) -> np.ndarray:
+        """Score a (population_size, n_features) boolean matrix"""
+        masks = np.asarray(masks, dtype=bool)
+        cv_scores = np.zeros(len(masks))
+
+        known = np.array([self.engine.is_known(mask) for mask in masks], dtype=bool)
+        if known.any():
+            cv_scores[known] = self.engine.cv_scores(masks[known])
+
+        candidates = np.flatnonzero(~known & masks.any(axis=1))
+        eliminated_by_rung = []
+        for rung, fraction in zip(self._rungs, self.fractions):
+            if len(candidates) == 0:
+                break
+            start, fits = time.perf_counter(), self.engine.model_fits
+            cv_scores[candidates] = self.engine.cv_scores(masks[candidates], fraction)
+            rung['evaluated'] += len(candidates)
+            rung['model_fits'] += self.engine.model_fits - fits
+            rung['seconds'] += time.perf_counter() - start
+            if fraction == self.fractions[-1]:
+                break
+
+            # Promote the top 1/eta to the next, larger subsample
+            order = np.argsort(-cv_scores[candidates], kind='stable')
+            n_promote = max(1, math.ceil(len(candidates) / self.eta))
+            rung['promoted'] += n_promote
+            eliminated_by_rung.append((candidates[order[n_promote:]], candidates[order[:n_promote]]))
+            candidates = candidates[order[:n_promote]]
+
+        # Keep the ranking consistent with the promotions, from the last rung back
+        for eliminated, promoted in reversed(eliminated_by_rung):
+            if len(eliminated):
+                cv_scores[eliminated] = np.minimum(cv_scores[eliminated], cv_scores[promoted].min())
+
+        return self.engine.penalize(masks, cv_scores)
+
+    def score(self, mask: np.ndarray) -> float:
+        """Score a single boolean feature mask"""
+        return float(self.score_population(np.asarray(mask, dtype=bool)[None, :])[0])
+
+    def stats(self) -> Dict[str, Any]:
+        info = self.engine.stats()
+        info['successive_halving'] = {
+            'eta': self.eta,
+            'rungs': [{**rung, 'seconds': round(rung['seconds'], 3)} for rung in self._rungs]
+        }
+        return info
@@ -1,6 +1,6 @@
-import pandas as pd
 import os
 from app.utils.error_handlers import APIError
+from app.utils.data_processor import load_dataset
 
 def validate_file(file):
     """Validate uploaded file"""
@@ -15,33 +15,33 @@ def validate_file(file):
     
     return file_extension
 
+def validate_dataframe(df, target_column):
+    """Validate the structure of an already parsed dataset"""
+    # Basic validation
+    if df.empty:
+        raise APIError("Dataset is empty")
+    
+    if df.shape[1] < 2:
+        raise APIError("Dataset must have at least 2 columns")
+    
+    if df.shape[0] < 10:
+        raise APIError("Dataset must have at least 10 rows")
+    
+    # Check target column exists
+    if target_column not in df.columns:
+        available_columns = list(df.columns)
+        raise APIError(f"Target column '{target_column}' not found. Available columns: {available_columns}")
+    
+    return df
+
 def validate_dataset_content(file_path, file_extension, target_column):
-    """Validate dataset content and structure - SIMPLIFIED VERSION"""
+    """Parse and validate dataset content; the returned frame can be handed to processing"""
     try:
-        # Load dataset based on file type
-        if file_extension == 'csv':
-            df = pd.read_csv(file_path)
-        elif file_extension == 'json':
-            df = pd.read_json(file_path)
-        else:  # Excel files
-            df = pd.read_excel(file_path)
-        
-        # Basic validation
-        if df.empty:
-            raise APIError("Dataset is empty")
-        
-        if df.shape[1] < 2:
-            raise APIError("Dataset must have at least 2 columns")
-        
-        if df.shape[0] < 10:
-            raise APIError("Dataset must have at least 10 rows")
-        
-        # Check target column exists
-        if target_column not in df.columns:
-            available_columns = list(df.columns)
-            raise APIError(f"Target column '{target_column}' not found. Available columns: {available_columns}")
-        
-        return df
-        
+        df = load_dataset(file_path, file_extension)
     except Exception as e:
-        raise APIError(f"Invalid dataset file: {str(e)}")
\ No newline at end of file
+        raise APIError(f"Invalid dataset file: {str(e)}")
+    
+    try:
+        return validate_dataframe(df, target_column)
+    except APIError as e:
+        raise APIError(f"Invalid dataset file: {e.message}")
\ No newline at end of file
@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Tuple
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import StratifiedKFold, KFold, train_test_split
+from app.utils.correlation_stats import correlation_with_target
+from app.utils.fitness_cache import FitnessCache, chromosome_key
+from app.utils.parallel import resolve_n_jobs
+
+WRAPPER_ESTIMATORS = {
+    'random_forest': lambda random_state: RandomForestClassifier(
+        n_estimators=50, random_state=random_state, n_jobs=1
+    ),
+    'logistic_regression': lambda random_state: make_pipeline(
+        StandardScaler(), LogisticRegression(max_iter=1000, random_state=random_state)
+    ),
+    'knn': lambda random_state: make_pipeline(StandardScaler(), KNeighborsClassifier()),
+}
+
+WRAPPER_SCORINGS = ('accuracy', 'f1')
+
+
+def fixed_cv_splits(y: np.ndarray, n_splits: int, random_state: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """CV splits drawn once per run; stratified unless a class is too small for it"""
+    _, counts = np.unique(y, return_counts=True)
+    if len(counts) > 1 and counts.min() >= n_splits:
+        cv = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    else:
+        cv = KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    return list(cv.split(np.zeros(len(y)), y))
+
+
+def _fold_score(estimator, X, y, columns, train, test, scoring):
+    """Fit on one training fold and score the held-out fold"""
+    model = clone(estimator).fit(X[np.ix_(train, columns)], y[train])
+    predictions = model.predict(X[np.ix_(test, columns)])
+    if scoring == 'f1':
+        return f1_score(y[test], predictions, average='weighted')
+    return accuracy_score(y[test], predictions)
+
+
+class WrapperFitness:
+    """
+    Cross-validated wrapper fitness: the k-fold CV accuracy (or weighted F1)
+    of an sklearn estimator on the selected features, minus the same
+    feature-count penalty as the correlation fitness.
+
+    CV splits are fixed once, (individual, fold) fits run in parallel with
+    joblib, and scores are memoized by chromosome. Scores can also be taken
+    on a fixed stratified row subsample (`fraction` < 1), which is what the
+    successive-halving evaluator builds on.
+    """
+
+    def __init__(self, X: pd.DataFrame, y, estimator: str = 'random_forest', scoring: str = 'accuracy',
+                 cv_folds: int = 5, n_jobs: int = 1, random_state: int = 42, cache_size: int = 4096):
+        if estimator not in WRAPPER_ESTIMATORS:
+            raise ValueError(f"Unknown wrapper estimator '{estimator}'")
+        if scoring not in WRAPPER_SCORINGS:
+            raise ValueError(f"Unknown wrapper scoring '{scoring}'")
+
+        self.columns = X.columns
+        self.n_total_features = X.shape[1]
+        self.estimator_name = estimator
+        self.estimator = WRAPPER_ESTIMATORS[estimator](random_state)
+        self.scoring = scoring
+        self.cv_folds = cv_folds
+        self.n_jobs = resolve_n_jobs(n_jobs)
+        self.random_state = random_state
+        self.cache_size = cache_size
+        self.model_fits = 0
+        self._X = X.to_numpy()
+        self._y = np.asarray(y)
+        self._X_frame, self._y_frame = X, y
+        # Splits and memo per row fraction; 1.0 is the full dataset
+        self._splits = {1.0: fixed_cv_splits(self._y, cv_folds, random_state)}
+        self._caches = {1.0: FitnessCache(cache_size)}
+        self._target_corr = None
+
+    @property
+    def target_corr(self) -> np.ndarray:
+        """|corr(X, y)|, used by the GA's fallback when nothing was evaluated (computed once)"""
+        if self._target_corr is None:
+            self._target_corr = correlation_with_target(self._X_frame, self._y_frame).abs().to_numpy()
+        return self._target_corr
+
+    def _splits_for(self, fraction: float):
+        """Fixed CV splits over a stratified subsample holding `fraction` of the rows"""
+        if fraction not in self._splits:
+            rows = np.arange(len(self._y))
+            # Keep at least two rows per fold so every split can be fitted
+            n_rows = max(int(round(fraction * len(rows))), 2 * self.cv_folds)
+            _, counts = np.unique(self._y, return_counts=True)
+            stratify = self._y if counts.min() >= 2 else None
+            if n_rows >= len(rows):
+                sample = rows
+            else:
+                sample, _ = train_test_split(rows, train_size=n_rows, random_state=self.random_state,
+                                             stratify=stratify)
+                sample = np.sort(sample)
+            self._splits[fraction] = [
+                (sample[train], sample[test])
+                for train, test in fixed_cv_splits(self._y[sample], self.cv_folds, self.random_state)
+            ]
+            self._caches[fraction] = FitnessCache(self.cache_size)
+        return self._splits[fraction]
+
+    def rows_for(self, fraction: float) -> int:
+        """Number of rows the CV splits at `fraction` cover"""
+        return int(sum(len(test) for _, test in self._splits_for(fraction)))
+
+    def is_known(self, mask: np.ndarray, fraction: float = 1.0) -> bool:
+        """True if the chromosome already has a memoized score at this fraction"""
+        self._splits_for(fraction)
+        return self._caches[fraction].peek(chromosome_key(mask)) is not None
+
+    def cv_scores(self, masks: np.ndarray, fraction: float = 1.0) -> np.ndarray:
+        """Mean CV score per mask, fitting only chromosomes missing from the memo"""
+        masks = np.asarray(masks, dtype=bool)
+        splits = self._splits_for(fraction)
+        cache = self._caches[fraction]
+        scores = np.zeros(len(masks))
+        pending = {}
+        for i, mask in enumerate(masks):
+            if not mask.any():
+                continue
+            key = chromosome_key(mask)
+            cached = cache.get(key)
+            if cached is not None:
+                scores[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+
+        if pending:
+            tasks = [(np.flatnonzero(masks[rows[0]]), train, test)
+                     for rows in pending.values() for train, test in splits]
+            if self.n_jobs > 1:
+                fold_scores = Parallel(n_jobs=self.n_jobs)(
+                    delayed(_fold_score)(self.estimator, self._X, self._y, cols, train, test, self.scoring)
+                    for cols, train, test in tasks
+                )
+            else:
+                fold_scores = [_fold_score(self.estimator, self._X, self._y, cols, train, test, self.scoring)
+                               for cols, train, test in tasks]
+            self.model_fits += len(tasks)
+
+            fold_scores = np.asarray(fold_scores).reshape(len(pending), len(splits))
+            for (key, rows), score in zip(pending.items(), fold_scores.mean(axis=1)):
+                cache.put(key, float(score))
+                scores[rows] = score
+        return scores
+
+    def penalize(self, masks: np.ndarray, cv_scores: np.ndarray) -> np.ndarray:
+        """Final fitness: CV score minus the feature-count penalty (0 for empty selections)"""
+        k = np.asarray(masks, dtype=bool).sum(axis=1)
+        scores = np.maximum(0.0, cv_scores - (k / self.n_total_features) * 0.1)
+        scores[k == 0] = 0.0
+        return scores
+
+    def score_population(self, masks: np.ndarray) -> np.ndarray:
+        """Score a (population_size, n_features) boolean matrix on the full data"""
+        return self.penalize(masks, self.cv_scores(masks))
+
+    def score(self, mask: np.ndarray) -> float:
+        """Score a single boolean feature mask"""
+        return float(self.score_population(np.asarray(mask, dtype=bool)[None, :])[0])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'estimator': self.estimator_name,
+            'scoring': self.scoring,
+            'cv_folds': self.cv_folds,
+            'model_fits': self.model_fits,
+            'memo': self._caches[1.0].stats()
+        }
@@ -0,0 +1,94 @@
+"""
+Benchmark upload ingestion: the legacy double parse vs the single-pass loader.
+
+Usage (from the backend directory):
+    python benchmarks/bench_ingest.py --rows 100000 --cols 50
+
+Each mode runs in a fresh subprocess so peak RSS is measured independently.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def make_dataset(path, rows, cols, seed=0):
+    """Synthetic CSV with 4-significant-digit floats and a string target"""
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame(
+        np.round(rng.normal(size=(rows, cols)) * 10, 3),
+        columns=[f"feature_{i}" for i in range(cols)]
+    )
+    data['target'] = np.where(data['feature_0'] + rng.normal(size=rows) > 0, 'M', 'B')
+    data.to_csv(path, index=False)
+
+
+def run_mode(mode, path):
+    from app.utils.data_processor import process_uploaded_file
+    from app.utils.validators import validate_dataset_content
+
+    start = time.perf_counter()
+    if mode == 'legacy':
+        # What the upload path used to do: parse for validation, then parse again
+        pd.read_csv(path)
+        X, y = process_uploaded_file(path, 'csv', 'target', df=pd.read_csv(path))
+    else:
+        df = validate_dataset_content(path, 'csv', 'target')
+        X, y = process_uploaded_file(path, 'csv', 'target', df=df)
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is reported in kilobytes on Linux
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {
+        'mode': mode,
+        'seconds': round(elapsed, 3),
+        'peak_rss_mb': round(peak_mb, 1),
+        'X_memory_mb': round(X.memory_usage(deep=True).sum() / 1024 / 1024, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--cols', type=int, default=50)
+    parser.add_argument('--mode', choices=['legacy', 'single'])
+    parser.add_argument('--path')
+    args = parser.parse_args()
+
+    if args.mode:
+        with open(os.devnull, 'w') as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                result = run_mode(args.mode, args.path)
+            finally:
+                sys.stdout = stdout
+        print(json.dumps(result))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.csv')
+        make_dataset(path, args.rows, args.cols)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        print(f"Dataset: {args.rows} rows x {args.cols} features ({size_mb:.1f} MB)")
+
+        for mode in ['legacy', 'single']:
+            output = subprocess.run(
+                [sys.executable, __file__, '--mode', mode, '--path', path],
+                check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{result['mode']:>7}: {result['seconds']:7.3f}s  "
+                  f"peak RSS {result['peak_rss_mb']:8.1f} MB  X {result['X_memory_mb']:6.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
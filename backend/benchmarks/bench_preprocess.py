@@ -0,0 +1,90 @@
+"""
+Benchmark cleaning on wide datasets: per-column loops vs the vectorized path.
+
+Usage (from the backend directory):
+    python benchmarks/bench_preprocess.py --rows 2000 --cols 5000
+
+Both implementations run on the same synthetic frame and must return
+identical results.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def make_dataset(rows, cols, seed=0):
+    """Genomics-style frame: mostly noise, some quasi-constant and sparse-missing columns"""
+    rng = np.random.default_rng(seed)
+    data = np.round(rng.normal(size=(rows, cols)), 3)
+    quasi = rng.random(cols) < 0.1
+    data[:, quasi] = np.where(rng.random((rows, quasi.sum())) < 0.995, 0.0, data[:, quasi])
+    data[rng.random((rows, cols)) < 0.01] = np.nan
+    X = pd.DataFrame(data, columns=[f"gene_{i}" for i in range(cols)])
+    X['batch'] = rng.choice(['a', 'b', None], size=rows)
+    y = pd.Series(rng.integers(0, 2, size=rows))
+    return X, y
+
+
+def legacy_remove_constant_features(X):
+    # What remove_constant_features used to do: value_counts per column
+    X = X.drop(columns=X.columns[X.nunique() <= 1])
+    quasi_constant = []
+    for col in X.columns:
+        if X[col].dtype in ['object', 'category']:
+            continue
+        if (X[col].value_counts().iloc[0] / len(X)) > 0.99:
+            quasi_constant.append(col)
+    return X.drop(columns=quasi_constant)
+
+
+def legacy_handle_missing_values(X, y):
+    # What handle_missing_values used to do: fillna column by column
+    X = X.copy()
+    for col in X.columns:
+        if X[col].isna().any():
+            if X[col].dtype in ['object', 'category']:
+                X[col] = X[col].fillna(X[col].mode()[0] if not X[col].mode().empty else 'missing')
+            else:
+                X[col] = X[col].fillna(X[col].median())
+    return X, y
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--cols', type=int, default=5000)
+    args = parser.parse_args()
+
+    from app.utils.data_processor import remove_constant_features, handle_missing_values
+
+    X, y = make_dataset(args.rows, args.cols)
+    print(f"Dataset: {args.rows} rows x {args.cols + 1} features")
+
+    legacy_X, legacy_constant = timed(legacy_remove_constant_features, X)
+    new_X, new_constant = timed(remove_constant_features, X)
+    assert list(legacy_X.columns) == list(new_X.columns)
+
+    (legacy_X, _), legacy_missing = timed(legacy_handle_missing_values, legacy_X, y)
+    (new_X, _), new_missing = timed(handle_missing_values, new_X, y)
+    pd.testing.assert_frame_equal(legacy_X, new_X)
+
+    print(f"{'step':>16} {'legacy':>9} {'vectorized':>11} {'speedup':>8}")
+    for step, legacy, new in [('constant filter', legacy_constant, new_constant),
+                              ('imputation', legacy_missing, new_missing)]:
+        print(f"{step:>16} {legacy:8.3f}s {new:10.3f}s {legacy / new:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
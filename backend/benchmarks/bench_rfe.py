@@ -0,0 +1,66 @@
+"""
+Benchmark RFE settings on a wide dataset: the default one-feature-per-round forest vs faster variants.
+
+Usage (from the backend directory):
+    python benchmarks/bench_rfe.py --rows 500 --cols 200 --n-features 10
+
+Every variant is also scored by 5-fold CV accuracy of a random forest on
+the features it selects.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+VARIANTS = [
+    ('default (step=1)', {}),
+    ('step=0.1', {'rfe_step': 0.1}),
+    ('step=0.1, n_jobs=-1', {'rfe_step': 0.1, 'rfe_n_jobs': -1}),
+    ('extra_trees, step=0.1', {'rfe_step': 0.1, 'rfe_estimator': 'extra_trees'}),
+    ('logistic, step=1', {'rfe_estimator': 'logistic_regression'}),
+]
+
+
+def make_dataset(rows, cols, informative=10, seed=0):
+    """Binary target driven by a few informative columns, the rest noise"""
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(rows, cols))
+    weights = np.zeros(cols)
+    weights[:informative] = rng.uniform(0.5, 1.5, size=informative)
+    y = (X @ weights + rng.normal(size=rows) > 0).astype(int)
+    return pd.DataFrame(X, columns=[f"x_{i}" for i in range(cols)]), pd.Series(y)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500)
+    parser.add_argument('--cols', type=int, default=200)
+    parser.add_argument('--n-features', type=int, default=10)
+    parser.add_argument('--skip-default', action='store_true', help="skip the slow step=1 forest")
+    args = parser.parse_args()
+
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.model_selection import cross_val_score
+    from app.TraditionalFeatureSelector import TraditionalFeatureSelector
+
+    X, y = make_dataset(args.rows, args.cols)
+    print(f"Dataset: {args.rows} rows x {args.cols} features, selecting {args.n_features}")
+    print(f"{'variant':>24} {'time':>8} {'CV accuracy':>12}")
+    for label, params in VARIANTS:
+        if args.skip_default and not params:
+            continue
+        selector = TraditionalFeatureSelector(n_features=args.n_features, method='rfe', **params)
+        start = time.perf_counter()
+        selected = selector._select_by_rfe(X, y, args.n_features)
+        elapsed = time.perf_counter() - start
+        accuracy = cross_val_score(RandomForestClassifier(random_state=0), X[selected], y, cv=5).mean()
+        print(f"{label:>24} {elapsed:7.1f}s {accuracy:12.4f}")
+
+
+if __name__ == '__main__':
+    main()
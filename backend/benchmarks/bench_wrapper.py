@@ -0,0 +1,62 @@
+"""
+Benchmark wrapper-fitness GA runs: full-data CV for every chromosome vs successive halving.
+
+Usage (from the backend directory):
+    python benchmarks/bench_wrapper.py --rows 20000 --cols 60
+
+Both runs use the same seed; the selected subsets are re-scored with full
+CV so their quality can be compared.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def make_dataset(rows, cols, informative=8, seed=0):
+    """Binary target driven by a few informative columns, the rest noise"""
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(rows, cols))
+    weights = np.zeros(cols)
+    weights[:informative] = rng.uniform(0.5, 1.5, size=informative)
+    y = (X @ weights + rng.normal(scale=2.0, size=rows) > 0).astype(int)
+    return pd.DataFrame(X, columns=[f"x_{i}" for i in range(cols)]), pd.Series(y)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--cols', type=int, default=60)
+    parser.add_argument('--estimator', default='logistic_regression')
+    parser.add_argument('--population', type=int, default=30)
+    parser.add_argument('--generations', type=int, default=10)
+    args = parser.parse_args()
+
+    from app.ga_feature_selection import GeneticFeatureSelector
+    from app.utils.wrapper_fitness import WrapperFitness
+
+    X, y = make_dataset(args.rows, args.cols)
+    reference = WrapperFitness(X, y, estimator=args.estimator)
+    print(f"Dataset: {args.rows} rows x {args.cols} features, estimator {args.estimator}")
+
+    print(f"{'mode':>18} {'time':>8} {'model fits':>11} {'features':>9} {'full CV fitness':>16}")
+    for label, params in [('full CV', {}), ('successive halving', {'successive_halving': True})]:
+        selector = GeneticFeatureSelector(
+            population_size=args.population, generations=args.generations, fitness='wrapper',
+            wrapper_estimator=args.estimator, **params
+        )
+        start = time.perf_counter()
+        results = selector.run(X, y)
+        elapsed = time.perf_counter() - start
+        mask = X.columns.isin(results['selected_features'])
+        print(f"{label:>18} {elapsed:7.1f}s {results['diagnostics']['wrapper']['model_fits']:>11} "
+              f"{mask.sum():>9} {reference.score(mask):16.4f}")
+
+
+if __name__ == '__main__':
+    main()
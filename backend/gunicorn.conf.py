@@ -0,0 +1,8 @@
+import os
+
+# Jobs, the dataset cache and the process pools live in the web process, so
+# status, result, cancel and dataset_id requests must reach the process that
+# created them: run a single worker and scale with threads.
+workers = 1
+threads = int(os.getenv('WEB_THREADS', 8))
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', 5000)}"